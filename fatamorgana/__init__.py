@@ -12,11 +12,12 @@
      - Inline compression
 
  fatamorana is written in pure python and only optionally depends on
-  numpy to speed up reading/writing.
+  numpy and isal to speed up reading/writing.
 
  Dependencies:
     - Python 3.11 or later
     - numpy (optional, faster but no additional functionality)
+    - isal (optional, faster CBlock decompression)
 
  To get started, try:
  ```python3
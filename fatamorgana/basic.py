@@ -2,17 +2,18 @@
 This module contains all datatypes and parsing/writing functions for
  all abstractions below the 'record' or 'block' level.
 """
-from typing import Any, IO, Union
+from typing import Any, ClassVar, IO, Union
 from collections.abc import Sequence
 from fractions import Fraction
 from enum import Enum
+import functools
+import io
 import math
 import struct
 import warnings
 
 try:
     import numpy
-    from numpy.typing import NDArray
     _USE_NUMPY = True
 except ImportError:
     _USE_NUMPY = False
@@ -82,6 +83,12 @@ class PathExtensionScheme(Enum):
 '''
 MAGIC_BYTES: bytes = b'%SEMI-OASIS\r\n'
 
+_SMALL_UINT_BYTES: list[bytes] = [bytes((ii,)) for ii in range(0x80)]
+"""Single-byte encodings of the uints 0-127"""
+
+_NUMPY_VARINT_MIN_LEN = 64
+"""Integer lists at least this long are varint-encoded with numpy instead of one value at a time"""
+
 
 '''
     Basic IO
@@ -133,7 +140,7 @@ def write_byte(stream: IO[bytes], n: int) -> int:
     return stream.write(bytes((n,)))
 
 
-def _py_read_bool_byte(stream: IO[bytes]) -> list[bool]:
+def read_bool_byte(stream: IO[bytes]) -> list[bool]:
     """
     Read a single byte from the stream, and interpret its bits as
       a list of 8 booleans.
@@ -145,10 +152,19 @@ def _py_read_bool_byte(stream: IO[bytes]) -> list[bool]:
         A list of 8 booleans corresponding to the bits (MSB first).
     """
     byte = _read(stream, 1)[0]
-    bits = [bool((byte >> i) & 0x01) for i in reversed(range(8))]
-    return bits
+    return [
+        bool(byte & 0x80),
+        bool(byte & 0x40),
+        bool(byte & 0x20),
+        bool(byte & 0x10),
+        bool(byte & 0x08),
+        bool(byte & 0x04),
+        bool(byte & 0x02),
+        bool(byte & 0x01),
+        ]
+
 
-def _py_write_bool_byte(stream: IO[bytes], bits: tuple[bool | int, ...]) -> int:
+def write_bool_byte(stream: IO[bytes], bits: tuple[bool | int, ...]) -> int:
     """
     Pack 8 booleans into a byte, and write it to the stream.
 
@@ -164,50 +180,19 @@ def _py_write_bool_byte(stream: IO[bytes], bits: tuple[bool | int, ...]) -> int:
     """
     if len(bits) != 8:
         raise InvalidDataError(f'write_bool_byte received {len(bits)} bits, requires 8')
-    byte = 0
-    for i, bit in enumerate(reversed(bits)):
-        byte |= bit << i
-    return stream.write(bytes((byte,)))
-
-
-if _USE_NUMPY:
-    def _np_read_bool_byte(stream: IO[bytes]) -> NDArray[numpy.uint8]:
-        """
-        Read a single byte from the stream, and interpret its bits as
-          a list of 8 booleans.
+    b7, b6, b5, b4, b3, b2, b1, b0 = bits
+    byte = (
+        (b7 << 7)
+        | (b6 << 6)
+        | (b5 << 5)
+        | (b4 << 4)
+        | (b3 << 3)
+        | (b2 << 2)
+        | (b1 << 1)
+        | b0
+        )
+    return stream.write(_SMALL_UINT_BYTES[byte] if byte < 0x80 else bytes((byte,)))
 
-        Args:
-            stream: Stream to read from.
-
-        Returns:
-            A list of 8 booleans corresponding to the bits (MSB first).
-        """
-        byte_arr = _read(stream, 1)
-        return numpy.unpackbits(numpy.frombuffer(byte_arr, dtype=numpy.uint8))
-
-    def _np_write_bool_byte(stream: IO[bytes], bits: tuple[bool | int, ...]) -> int:
-        """
-        Pack 8 booleans into a byte, and write it to the stream.
-
-        Args:
-            stream: Stream to write to.
-            bits: A list of 8 booleans corresponding to the bits (MSB first).
-
-        Returns:
-            Number of bytes written (1).
-
-        Raises:
-            InvalidDataError if didn't receive 8 bits.
-        """
-        if len(bits) != 8:
-            raise InvalidDataError(f'write_bool_byte received {len(bits)} bits, requires 8')
-        return stream.write(numpy.packbits(bits)[0])
-
-    read_bool_byte = _np_read_bool_byte    # type: ignore
-    write_bool_byte = _np_write_bool_byte
-else:
-    read_bool_byte = _py_read_bool_byte    # type: ignore
-    write_bool_byte = _py_write_bool_byte
 
 def read_uint(stream: IO[bytes]) -> int:
     """
@@ -224,15 +209,21 @@ def read_uint(stream: IO[bytes]) -> int:
     Returns:
         The integer's value.
     """
-    result = 0
-    i = 0
-    byte = _read(stream, 1)[0]
-    result |= byte & 0x7f
-    while byte & 0x80:
-        i += 1
-        byte = _read(stream, 1)[0]
-        result |= (byte & 0x7f) << (7 * i)
-    return result
+    try:
+        byte = stream.read(1)[0]
+        if byte < 0x80:
+            return byte
+
+        result = byte & 0x7f
+        shift = 7
+        while True:
+            byte = stream.read(1)[0]
+            result |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+    except IndexError:
+        raise EOFError('Unexpected EOF') from None
 
 
 def write_uint(stream: IO[bytes], n: int) -> int:
@@ -250,20 +241,21 @@ def write_uint(stream: IO[bytes], n: int) -> int:
     Raises:
         SignedError: if `n` is negative.
     """
-    if n < 0:
-        raise SignedError(f'uint must be positive: {n}')
-
-    current = n
-    byte_list = []
-    while True:
-        byte = current & 0x7f
-        current >>= 7
-        if current != 0:
-            byte |= 0x80
-            byte_list.append(byte)
-        else:
-            byte_list.append(byte)
-            break
+    if n < 0x80:
+        if n < 0:
+            raise SignedError(f'uint must be positive: {n}')
+        return stream.write(_SMALL_UINT_BYTES[n])
+
+    if n < 0x4000:
+        return stream.write(bytes((0x80 | (n & 0x7f), n >> 7)))
+    if n < 0x20_0000:
+        return stream.write(bytes((0x80 | (n & 0x7f), 0x80 | ((n >> 7) & 0x7f), n >> 14)))
+
+    # 7 bits per byte; all but the last byte have their MSB set
+    n = int(n)      # numpy integers lack bit_length()
+    last = 7 * ((n.bit_length() - 1) // 7)
+    byte_list = [0x80 | ((n >> shift) & 0x7f) for shift in range(0, last, 7)]
+    byte_list.append(n >> last)
     return stream.write(bytes(byte_list))
 
 
@@ -309,7 +301,10 @@ def read_sint(stream: IO[bytes]) -> int:
     Returns:
         The integer's value.
     """
-    return decode_sint(read_uint(stream))
+    uint = read_uint(stream)
+    if uint & 0x01:
+        return -(uint >> 1)
+    return uint >> 1
 
 
 def write_sint(stream: IO[bytes], n: int) -> int:
@@ -324,7 +319,53 @@ def write_sint(stream: IO[bytes], n: int) -> int:
     Returns:
         The number of bytes written.
     """
-    return write_uint(stream, encode_sint(n))
+    if -0x40 < n < 0x40:
+        return stream.write(_SMALL_UINT_BYTES[(-n << 1) | 0x01 if n < 0 else n << 1])
+    if n < 0:
+        return write_uint(stream, (-n << 1) | 0x01)
+    return write_uint(stream, n << 1)
+
+
+def _encode_uint_array(uints: Any) -> bytes:
+    """
+    Encode a 1D `numpy.uint64` array of unsigned integers in one pass.
+    The output is identical to calling `write_uint()` on each value in turn.
+
+    Args:
+        uints: Values to encode.
+
+    Returns:
+        The encoded bytes.
+    """
+    num_groups = max(1, (int(uints.max()).bit_length() + 6) // 7)
+    remainders = uints[:, None] >> numpy.arange(0, 7 * num_groups, 7, dtype=numpy.uint64)
+    groups = (remainders & 0x7f).astype(numpy.uint8)
+    groups[:, :-1] |= (remainders[:, 1:] != 0).astype(numpy.uint8) << 7
+    keep = remainders != 0
+    keep[:, 0] = True
+    return groups[keep].tobytes()
+
+
+def _write_uints(stream: IO[bytes], uints: list[int]) -> int:
+    """
+    Write a list of unsigned integers to the stream, as if by repeated `write_uint()`.
+    Long lists are encoded with numpy if it is available.
+
+    Args:
+        stream: Stream to write to.
+        uints: Values to write.
+
+    Returns:
+        The number of bytes written.
+    """
+    if _USE_NUMPY and len(uints) >= _NUMPY_VARINT_MIN_LEN:
+        try:
+            arr = numpy.array(uints, dtype=numpy.uint64)
+        except OverflowError:
+            pass
+        else:
+            return stream.write(_encode_uint_array(arr))
+    return sum(write_uint(stream, int(n)) for n in uints)
 
 
 def read_bstring(stream: IO[bytes]) -> bytes:
@@ -356,8 +397,8 @@ def write_bstring(stream: IO[bytes], bstring: bytes) -> int:
     Returns:
         The number of bytes written.
     """
-    write_uint(stream, len(bstring))
-    return stream.write(bstring)
+    size = write_uint(stream, len(bstring))
+    return size + stream.write(bstring)
 
 
 def read_ratio(stream: IO[bytes]) -> Fraction:
@@ -553,6 +594,36 @@ def write_real(
     return size
 
 
+# Bytes allowed in n-strings and a-strings. Deleting these with bytes.translate()
+#  leaves any invalid bytes, without looping over the string in Python.
+_NSTRING_BYTES = bytes(range(0x21, 0x7f))
+_ASTRING_BYTES = bytes(range(0x20, 0x7f))
+
+
+def _is_nstring(bstring: bytes) -> bool:
+    return len(bstring) > 0 and not bstring.translate(None, _NSTRING_BYTES)
+
+
+def _is_astring(bstring: bytes) -> bool:
+    return not bstring.translate(None, _ASTRING_BYTES)
+
+
+# Names and strings tend to repeat throughout a file (cell names, text strings,
+#  property names), so remember recently validated/decoded values.
+@functools.lru_cache(maxsize=4096)
+def _decode_nstring(bstring: bytes) -> str:
+    if not _is_nstring(bstring):
+        raise InvalidDataError(f'Invalid n-string {bstring!r}')
+    return bstring.decode('ascii')
+
+
+@functools.lru_cache(maxsize=4096)
+def _decode_astring(bstring: bytes) -> str:
+    if not _is_astring(bstring):
+        raise InvalidDataError(f'Invalid a-string "{bstring!r}"')
+    return bstring.decode('ascii')
+
+
 class NString:
     """
     Class for handling "name strings", which hold one or more
@@ -564,6 +635,9 @@ class NString:
     """
     _string: str
 
+    _encoded: bytes_t | None = None
+    """Cached bstring encoding (length + bytes), as produced by `write()`"""
+
     def __init__(self, string_or_bytes: bytes | str) -> None:
         """
         Args:
@@ -574,15 +648,22 @@ class NString:
         else:
             self.bytes = string_or_bytes
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'NString':
+        new = NString.__new__(NString)
+        new._string = self._string
+        new._encoded = self._encoded
+        return new
+
     @property
     def string(self) -> str:
         return self._string
 
     @string.setter
     def string(self, string: str) -> None:
-        if len(string) == 0 or not all(0x21 <= ord(c) <= 0x7e for c in string):
+        if not (string.isascii() and _is_nstring(string.encode('ascii'))):
             raise InvalidDataError(f'Invalid n-string {string}')
         self._string = string
+        self._encoded = None
 
     @property
     def bytes(self) -> bytes:
@@ -590,9 +671,8 @@ class NString:
 
     @bytes.setter
     def bytes(self, bstring: bytes) -> None:
-        if len(bstring) == 0 or not all(0x21 <= c <= 0x7e for c in bstring):
-            raise InvalidDataError(f'Invalid n-string {bstring!r}')
-        self._string = bstring.decode('ascii')
+        self._string = _decode_nstring(bytes(bstring))
+        self._encoded = None
 
     @staticmethod
     def read(stream: IO[bytes_t]) -> 'NString':
@@ -620,7 +700,11 @@ class NString:
         Returns:
             Number of bytes written.
         """
-        return write_bstring(stream, self.bytes)
+        if self._encoded is None:
+            buf = io.BytesIO()
+            write_bstring(buf, self.bytes)
+            self._encoded = buf.getvalue()
+        return stream.write(self._encoded)
 
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, type(self)) and self.string == other.string
@@ -678,6 +762,9 @@ class AString:
     """
     _string: str
 
+    _encoded: bytes_t | None = None
+    """Cached bstring encoding (length + bytes), as produced by `write()`"""
+
     def __init__(self, string_or_bytes: bytes | str) -> None:
         """
         Args:
@@ -688,15 +775,22 @@ class AString:
         else:
             self.bytes = string_or_bytes
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'AString':
+        new = AString.__new__(AString)
+        new._string = self._string
+        new._encoded = self._encoded
+        return new
+
     @property
     def string(self) -> str:
         return self._string
 
     @string.setter
     def string(self, string: str) -> None:
-        if not all(0x20 <= ord(c) <= 0x7e for c in string):
+        if not (string.isascii() and _is_astring(string.encode('ascii'))):
             raise InvalidDataError(f'Invalid a-string "{string}"')
         self._string = string
+        self._encoded = None
 
     @property
     def bytes(self) -> bytes:
@@ -704,9 +798,8 @@ class AString:
 
     @bytes.setter
     def bytes(self, bstring: bytes) -> None:
-        if not all(0x20 <= c <= 0x7e for c in bstring):
-            raise InvalidDataError(f'Invalid a-string "{bstring!r}"')
-        self._string = bstring.decode('ascii')
+        self._string = _decode_astring(bytes(bstring))
+        self._encoded = None
 
     @staticmethod
     def read(stream: IO[bytes_t]) -> 'AString':
@@ -734,7 +827,11 @@ class AString:
         Returns:
             Number of bytes written.
         """
-        return write_bstring(stream, self.bytes)
+        if self._encoded is None:
+            buf = io.BytesIO()
+            write_bstring(buf, self.bytes)
+            self._encoded = buf.getvalue()
+        return stream.write(self._encoded)
 
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, type(self)) and self.string == other.string
@@ -1149,21 +1246,39 @@ class ReuseRepetition:
     """
     Class representing a "reuse" repetition entry, which indicates that
      the most recently written repetition should be reused.
+
+    The class is stateless, so all instances are the same object
+     (`_REUSE_REPETITION`), allowing cheap identity checks.
     """
+    __slots__ = ()
+
+    _instance: ClassVar['ReuseRepetition | None'] = None
+
+    def __new__(cls) -> 'ReuseRepetition':
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     @staticmethod
     def read(_stream: IO[bytes], _repetition_type: int) -> 'ReuseRepetition':
         return ReuseRepetition()
 
     def write(self, stream: IO[bytes]) -> int:
-        return write_uint(stream, 0)
+        return stream.write(_SMALL_UINT_BYTES[0])
 
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, ReuseRepetition)
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'ReuseRepetition':
+        return ReuseRepetition()
+
     def __repr__(self) -> str:
         return 'ReuseRepetition'
 
 
+_REUSE_REPETITION = ReuseRepetition()
+
+
 class GridRepetition:
     """
     A repetition entry denoting a 1D or 2D array of regularly-spaced elements. The
@@ -1231,6 +1346,14 @@ class GridRepetition:
         self.a_count = a_count
         self.b_count = b_count
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'GridRepetition':
+        new = GridRepetition.__new__(GridRepetition)
+        new.a_vector = list(self.a_vector)
+        new.b_vector = list(self.b_vector) if self.b_vector is not None else None
+        new.a_count = self.a_count
+        new.b_count = self.b_count
+        return new
+
     @staticmethod
     def read(stream: IO[bytes], repetition_type: int) -> 'GridRepetition':
         """
@@ -1299,32 +1422,32 @@ class GridRepetition:
                 raise InvalidDataError(f'Malformed repetition {self}')
 
             if self.a_vector[1] == 0:
-                size = write_uint(stream, 2)
+                size = stream.write(_SMALL_UINT_BYTES[2])
                 size += write_uint(stream, self.a_count - 2)
                 size += write_uint(stream, self.a_vector[0])
             elif self.a_vector[0] == 0:
-                size = write_uint(stream, 3)
+                size = stream.write(_SMALL_UINT_BYTES[3])
                 size += write_uint(stream, self.a_count - 2)
                 size += write_uint(stream, self.a_vector[1])
             else:
-                size = write_uint(stream, 9)
+                size = stream.write(_SMALL_UINT_BYTES[9])
                 size += write_uint(stream, self.a_count - 2)
                 size += Delta(*self.a_vector).write(stream)
         else:   # noqa: PLR5501
             if self.a_vector[1] == 0 and self.b_vector[0] == 0:
-                size = write_uint(stream, 1)
+                size = stream.write(_SMALL_UINT_BYTES[1])
                 size += write_uint(stream, self.a_count - 2)
                 size += write_uint(stream, self.b_count - 2)
                 size += write_uint(stream, self.a_vector[0])
                 size += write_uint(stream, self.b_vector[1])
             elif self.a_vector[0] == 0 and self.b_vector[1] == 0:
-                size = write_uint(stream, 1)
+                size = stream.write(_SMALL_UINT_BYTES[1])
                 size += write_uint(stream, self.b_count - 2)
                 size += write_uint(stream, self.a_count - 2)
                 size += write_uint(stream, self.b_vector[0])
                 size += write_uint(stream, self.a_vector[1])
             else:
-                size = write_uint(stream, 8)
+                size = stream.write(_SMALL_UINT_BYTES[8])
                 size += write_uint(stream, self.a_count - 2)
                 size += write_uint(stream, self.b_count - 2)
                 size += Delta(*self.a_vector).write(stream)
@@ -1375,6 +1498,9 @@ class ArbitraryRepetition:
         self.x_displacements = list(x_displacements)
         self.y_displacements = list(y_displacements)
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'ArbitraryRepetition':
+        return ArbitraryRepetition(self.x_displacements, self.y_displacements)
+
     @staticmethod
     def read(stream: IO[bytes], repetition_type: int) -> 'ArbitraryRepetition':
         """
@@ -1462,33 +1588,33 @@ class ArbitraryRepetition:
         y_gcd = get_gcd(self.y_displacements)
         if y_gcd == 0:
             if x_gcd <= 1:
-                size = write_uint(stream, 4)
+                size = stream.write(_SMALL_UINT_BYTES[4])
                 size += write_uint(stream, len(self.x_displacements) - 1)
                 size += sum(write_uint(stream, d) for d in self.x_displacements)
             else:
-                size = write_uint(stream, 5)
+                size = stream.write(_SMALL_UINT_BYTES[5])
                 size += write_uint(stream, len(self.x_displacements) - 1)
                 size += write_uint(stream, x_gcd)
                 size += sum(write_uint(stream, d // x_gcd) for d in self.x_displacements)
         elif x_gcd == 0:
             if y_gcd <= 1:
-                size = write_uint(stream, 6)
+                size = stream.write(_SMALL_UINT_BYTES[6])
                 size += write_uint(stream, len(self.y_displacements) - 1)
                 size += sum(write_uint(stream, d) for d in self.y_displacements)
             else:
-                size = write_uint(stream, 7)
+                size = stream.write(_SMALL_UINT_BYTES[7])
                 size += write_uint(stream, len(self.y_displacements) - 1)
                 size += write_uint(stream, y_gcd)
                 size += sum(write_uint(stream, d // y_gcd) for d in self.y_displacements)
         else:
             gcd = math.gcd(x_gcd, y_gcd)
             if gcd <= 1:
-                size = write_uint(stream, 10)
+                size = stream.write(_SMALL_UINT_BYTES[10])
                 size += write_uint(stream, len(self.x_displacements) - 1)
                 size += sum(Delta(x, y).write(stream)
                             for x, y in zip(self.x_displacements, self.y_displacements, strict=True))
             else:
-                size = write_uint(stream, 11)
+                size = stream.write(_SMALL_UINT_BYTES[11])
                 size += write_uint(stream, len(self.x_displacements) - 1)
                 size += write_uint(stream, gcd)
                 size += sum(Delta(x // gcd, y // gcd).write(stream)
@@ -1511,6 +1637,8 @@ def read_point_list(
     """
     Read a point list from a stream.
 
+    If numpy is available, the points are returned as an `(N, 2)` int64 array.
+
     Args:
         stream: Stream to read from.
         implicit_closed: If true, the source point list is assumed to be implicitly
@@ -1524,42 +1652,36 @@ def read_point_list(
     """
     list_type = read_uint(stream)
     list_len = read_uint(stream)
-    if list_type == 0:
-        points = []
-        for i in range(list_len):
-            n = read_sint(stream)
-            if n == 0:
-                raise InvalidDataError('Zero-sized 1-delta')
-            point = [0, 0]
-            point[i % 2] = n
-            points.append(point)
-    elif list_type == 1:
-        points = []
-        for i in range(list_len):
-            n = read_sint(stream)
-            if n == 0:
-                raise InvalidDataError('Zero-sized 1-delta')
-            point = [0, 0]
-            point[(i + 1) % 2] = n
-            points.append(point)
-    elif list_type == 2:
-        points = [ManhattanDelta.read(stream).as_list() for _ in range(list_len)]
-    elif list_type == 3:
-        points = [OctangularDelta.read(stream).as_list() for _ in range(list_len)]
-    elif list_type == 4:
-        points = [Delta.read(stream).as_list() for _ in range(list_len)]
-    elif list_type == 5:
-        deltas = [Delta.read(stream).as_list() for _ in range(list_len)]
+    if list_type in (0, 1):
+        values = [read_sint(stream) for _ in range(list_len)]
+        if 0 in values:
+            raise InvalidDataError('Zero-sized 1-delta')
+        # type 0 starts horizontal, type 1 starts vertical
         if _USE_NUMPY:
-            points = numpy.cumsum(deltas, axis=0)
+            points = numpy.zeros((list_len, 2), dtype=numpy.int64)
+            points[0::2, list_type] = values[0::2]
+            points[1::2, 1 - list_type] = values[1::2]
         else:
             points = []
+            for i, n in enumerate(values):
+                point = [0, 0]
+                point[(i + list_type) % 2] = n
+                points.append(point)
+    elif list_type in (2, 3, 4, 5):
+        delta_type = {2: ManhattanDelta, 3: OctangularDelta}.get(list_type, Delta)
+        points = [delta_type.read(stream).as_list() for _ in range(list_len)]
+        if _USE_NUMPY:
+            points = numpy.array(points, dtype=numpy.int64).reshape(list_len, 2)
+            if list_type == 5:
+                points = numpy.cumsum(points, axis=0)
+        elif list_type == 5:
             x = 0
             y = 0
-            for delta in deltas:
-                x += delta[0]
-                y += delta[1]
-                points.append([x, y])
+            for point in points:
+                x += point[0]
+                y += point[1]
+                point[0] = x
+                point[1] = y
     else:
         raise InvalidDataError('Invalid point list type')
 
@@ -1643,15 +1765,10 @@ def write_point_list(
         previous = point
 
     # If one of h_first or v_first, write a bunch of 1-deltas
-    if h_first:
-        size = write_uint(stream, 0)
+    if h_first or v_first:
+        size = write_uint(stream, 0 if h_first else 1)
         size += write_uint(stream, len(points))
-        size += sum(write_sint(stream, x + y) for x, y in points)
-        return size
-    if v_first:
-        size = write_uint(stream, 1)
-        size += write_uint(stream, len(points))
-        size += sum(write_sint(stream, x + y) for x, y in points)
+        size += _write_uints(stream, [encode_sint(x + y) for x, y in points])
         return size
 
     # Try writing a bunch of Manhattan or Octangular deltas
@@ -1673,7 +1790,7 @@ def write_point_list(
     if list_type is not None:
         size = write_uint(stream, list_type)
         size += write_uint(stream, len(points))
-        size += sum(d.write(stream) for d in deltas)
+        size += _write_uints(stream, [d.as_uint() for d in deltas])
         return size
 
     '''
@@ -1721,7 +1838,7 @@ class PropStringReference:
     ref: int
     """ID of the target"""
 
-    reference_type: type
+    ref_type: type
     """Type of the target: `bytes`, `NString`, or `AString`"""
 
     def __init__(self, ref: int, ref_type: type) -> None:
@@ -1733,8 +1850,11 @@ class PropStringReference:
         self.ref = ref
         self.ref_type = ref_type
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'PropStringReference':
+        return PropStringReference(self.ref, self.ref_type)
+
     def __eq__(self, other: Any) -> bool:
-        return isinstance(other, type(self)) and self.ref == other.ref and self.reference_type is other.reference_type
+        return isinstance(other, type(self)) and self.ref == other.ref and self.ref_type is other.ref_type
 
     def __repr__(self) -> str:
         return f'[{self.ref_type} : {self.ref}]'
@@ -1845,8 +1965,10 @@ def write_property_value(
             size = write_uint(stream, 13)
         elif value.ref_type is bytes:
             size = write_uint(stream, 14)
-        if value.ref_type is AString:
+        elif value.ref_type is NString:
             size = write_uint(stream, 15)
+        else:
+            raise InvalidDataError(f'Invalid PropStringReference type: {value.ref_type}')
         size += write_uint(stream, value.ref)
     else:
         raise InvalidDataError(f'Invalid property type: {type(value)} ({value})')
@@ -2213,6 +2335,15 @@ class Validation:
             return write_uint(stream, 2) + write_u32(stream, self.checksum)
         raise InvalidDataError(f'Unrecognized checksum type: {self.checksum_type}')
 
+    def byte_length(self) -> int:
+        """
+        Number of bytes `write()` will produce for this validation entry.
+
+        Returns:
+            `1` if there is no checksum, `5` otherwise.
+        """
+        return 1 if self.checksum_type == 0 else 5
+
     def __repr__(self) -> str:
         return f'Validation(type: {self.checksum_type} sum: {self.checksum})'
 
@@ -6,6 +6,7 @@ This module contains data structures and functions for reading from and
 from typing import IO
 import io
 import logging
+import mmap
 
 from . import records
 from .records import Modals, Record
@@ -23,6 +24,13 @@ __author__ = 'Jan Petykiewicz'
 logger = logging.getLogger(__name__)
 
 
+_WRITE_BUFFER_SIZE = 1 << 20
+"""Buffer size used when `OasisLayout.write()` is handed an unbuffered stream"""
+
+_READ_BUFFER_SIZE = 1 << 20
+"""Buffer size used when `OasisLayout.read()` is handed an unbuffered stream"""
+
+
 class FileModals:
     """
     File-scoped modal variables
@@ -128,6 +136,29 @@ class OasisLayout:
         Returns:
             New `OasisLayout` object.
         """
+        if isinstance(stream, io.RawIOBase):
+            # Unbuffered streams would otherwise see one read() call (syscall) per byte
+            buffered_stream = io.BufferedReader(stream, buffer_size=_READ_BUFFER_SIZE)
+            try:
+                return OasisLayout.read(buffered_stream)
+            finally:
+                # Leave the caller's stream just past the data we used, not wherever
+                #  the read-ahead stopped
+                if stream.seekable():
+                    stream.seek(buffered_stream.tell())
+                buffered_stream.detach()        # don't close the caller's stream
+
+        # Reading small chunks from a memory-mapped file is cheaper than
+        #  going through BufferedReader, and avoids copying the file.
+        mapped = _map_file(stream)
+        if mapped is not None:
+            with mapped:
+                mapped.seek(stream.tell())
+                try:
+                    return OasisLayout.read(mapped)
+                finally:
+                    stream.seek(mapped.tell())
+
         layout = OasisLayout(unit=-1)    # dummy unit
         modals = Modals()
         file_state = FileModals(layout.properties)
@@ -168,7 +199,8 @@ class OasisLayout:
                 return True
             raise
 
-        logger.info(f'read_record of type {record_id} at position 0x{stream.tell():x}')
+        if logger.isEnabledFor(logging.INFO):
+            logger.info('read_record of type %d at position 0x%x', record_id, stream.tell())
 
         record: Record
 
@@ -177,10 +209,9 @@ class OasisLayout:
             if file_state.within_cblock:
                 raise InvalidRecordError('Nested CBlock')
             record = records.CBlock.read(stream, record_id)
-            decoded_data = record.decompress()
 
             file_state.within_cblock = True
-            decoded_stream = io.BytesIO(decoded_data)
+            decoded_stream = io.BufferedReader(records.CBlockReader(record))
             while not self.read_record(decoded_stream, modals, file_state):
                 pass
             file_state.within_cblock = False
@@ -189,6 +220,19 @@ class OasisLayout:
         # Make sure order is valid (eg, no out-of-cell geometry)
         if not file_state.started and record_id != 1:
             raise InvalidRecordError(f'Non-Start record {record_id} before Start')
+
+        # Geometry makes up the bulk of most files, so look it up before
+        #  walking the chain of checks for the other record types.
+        geometry_type = _GEOMETRY.get(record_id)
+        if geometry_type is not None:
+            if not file_state.within_cell:
+                raise InvalidRecordError('Geometry outside Cell')
+            record = geometry_type.read(stream, record_id)
+            record.merge_with_modals(modals)
+            self.cells[-1].geometry.append(record)
+            file_state.property_target = record.properties
+            return False
+
         if record_id == 1:
             if file_state.started:
                 raise InvalidRecordError('Duplicate Start record')
@@ -208,7 +252,25 @@ class OasisLayout:
         else:
             raise InvalidRecordError(f'Unknown record id: {record_id}')
 
-        if record_id == 0:
+        # Cell and elements; checked first since Placements are common
+        if record_id in (17, 18):
+            ''' Placement '''
+            record = records.Placement.read(stream, record_id)
+            record.merge_with_modals(modals)
+            self.cells[-1].placements.append(record)
+            file_state.property_target = record.properties
+        elif record_id in (13, 14):
+            ''' Cell '''
+            record = records.Cell.read(stream, record_id)
+            record.merge_with_modals(modals)
+            cell = Cell(record.name)
+            self.cells.append(cell)
+            file_state.property_target = cell.properties
+        elif record_id in (15, 16):
+            ''' XYMode '''
+            record = records.XYMode.read(stream, record_id)
+            record.merge_with_modals(modals)
+        elif record_id == 0:
             ''' Pad '''
             pass
         elif record_id == 1:
@@ -313,32 +375,6 @@ class OasisLayout:
             self.xnames[key] = XName.from_record(record)
             # TODO: do anything with property target?
 
-        #
-        # Cell and elements
-        #
-        elif record_id in (13, 14):
-            ''' Cell '''
-            record = records.Cell.read(stream, record_id)
-            record.merge_with_modals(modals)
-            cell = Cell(record.name)
-            self.cells.append(cell)
-            file_state.property_target = cell.properties
-        elif record_id in (15, 16):
-            ''' XYMode '''
-            record = records.XYMode.read(stream, record_id)
-            record.merge_with_modals(modals)
-        elif record_id in (17, 18):
-            ''' Placement '''
-            record = records.Placement.read(stream, record_id)
-            record.merge_with_modals(modals)
-            self.cells[-1].placements.append(record)
-            file_state.property_target = record.properties
-        elif record_id in _GEOMETRY:
-            ''' Geometry '''
-            record = _GEOMETRY[record_id].read(stream, record_id)
-            record.merge_with_modals(modals)
-            self.cells[-1].geometry.append(record)
-            file_state.property_target = record.properties
         else:
             raise InvalidRecordError(f'Unknown record id: {record_id}')
         return False
@@ -356,6 +392,18 @@ class OasisLayout:
         Raises:
             InvalidDataError: if contained records are invalid.
         """
+        if not isinstance(stream, io.RawIOBase):
+            return self._write(stream)
+
+        # Unbuffered streams would otherwise see one tiny write() per field
+        buffered_stream = io.BufferedWriter(stream, buffer_size=_WRITE_BUFFER_SIZE)
+        try:
+            return self._write(buffered_stream)
+        finally:
+            buffered_stream.flush()
+            buffered_stream.detach()        # don't close the caller's stream
+
+    def _write(self, stream: IO[bytes]) -> int:
         modals = Modals()
 
         size = 0
@@ -401,6 +449,25 @@ class OasisLayout:
         return size
 
 
+def _map_file(stream: IO[bytes]) -> mmap.mmap | None:
+    """
+    Memory-map (read-only) the file underlying a stream returned by `open(..., 'rb')`.
+
+    Args:
+        stream: Stream to map.
+
+    Returns:
+        The mapped file, or `None` if `stream` is not a buffered reader over a
+         regular file, or the file can't be mapped (e.g. pipes, empty files).
+    """
+    if not (isinstance(stream, io.BufferedReader) and isinstance(stream.raw, io.FileIO)):
+        return None
+    try:
+        return mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError, OverflowError):
+        return None
+
+
 class Cell:
     """
     Representation of an OASIS cell.
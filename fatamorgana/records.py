@@ -10,28 +10,38 @@ Higher-level code (e.g. monitoring for combinations of records with
  parse, or code for dealing with nested records in a CBlock) should live
  in main.py instead.
 """
-from typing import Any, TypeVar, IO, Union, Protocol
-from collections.abc import Sequence
+from typing import Any, ClassVar, TypeVar, IO, Union, Protocol
+from collections.abc import Sequence, Iterator, Callable
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 import copy
 import math
-import zlib
 import io
 import logging
 import pprint
+import zlib
 from warnings import warn
 from .basic import (
     AString, NString, repetition_t, property_value_t, real_t,
-    ReuseRepetition, OffsetTable, Validation, read_point_list, read_property_value,
+    OffsetTable, Validation, read_point_list, read_property_value,
     read_bstring, read_uint, read_sint, read_real, read_repetition, read_interval,
     write_bstring, write_uint, write_sint, write_real, write_interval, write_point_list,
-    write_property_value, read_bool_byte, write_bool_byte, read_byte, write_byte,
-    InvalidDataError, UnfilledModalError, PathExtensionScheme, _USE_NUMPY,
+    write_property_value, read_bool_byte, read_byte,
+    InvalidDataError, UnfilledModalError, PathExtensionScheme, _USE_NUMPY, _REUSE_REPETITION,
     )
 
 if _USE_NUMPY:
     import numpy
 
+try:
+    # isal's inflate is a drop-in replacement for zlib's, just faster.
+    #  Compression always uses zlib, since isal's levels (and output) differ.
+    from isal import isal_zlib as _inflate_zlib
+    _USE_ISAL = True
+except ImportError:
+    _inflate_zlib = zlib
+    _USE_ISAL = False
+
 
 logger = logging.getLogger(__name__)
 
@@ -49,32 +59,56 @@ class Modals:
     """
     Modal variables, used to store data about previously-written or -read records.
     """
-    repetition: repetition_t | None = None
-    placement_x: int = 0
-    placement_y: int = 0
-    placement_cell: NString | None = None
-    layer: int | None = None
-    datatype: int | None = None
-    text_layer: int | None = None
-    text_datatype: int | None = None
-    text_x: int = 0
-    text_y: int = 0
-    text_string: AString | int | None = None
-    geometry_x: int = 0
-    geometry_y: int = 0
-    xy_relative: bool = False
-    geometry_w: int | None = None
-    geometry_h: int | None = None
-    polygon_point_list: point_list_t | None = None
-    path_half_width: int | None = None
-    path_point_list: point_list_t | None = None
-    path_extension_start: pathextension_t | None = None
-    path_extension_end: pathextension_t | None = None
-    ctrapezoid_type: int | None = None
-    circle_radius: int | None = None
-    property_value_list: Sequence[property_value_t] | None = None
-    property_name: int | NString | None = None
-    property_is_standard: bool | None = None
+    __slots__ = (
+        'repetition',
+        'placement_x', 'placement_y', 'placement_cell',
+        'layer', 'datatype',
+        'text_layer', 'text_datatype', 'text_x', 'text_y', 'text_string',
+        'geometry_x', 'geometry_y', 'xy_relative', 'geometry_w', 'geometry_h',
+        'polygon_point_list',
+        'path_half_width', 'path_point_list', 'path_extension_start', 'path_extension_end',
+        'ctrapezoid_type',
+        'circle_radius',
+        'property_value_list', 'property_name', 'property_is_standard',
+        )
+
+    repetition: repetition_t | None
+    placement_x: int
+    placement_y: int
+    placement_cell: NString | None
+    layer: int | None
+    datatype: int | None
+    text_layer: int | None
+    text_datatype: int | None
+    text_x: int
+    text_y: int
+    text_string: AString | int | None
+    geometry_x: int
+    geometry_y: int
+    xy_relative: bool
+    geometry_w: int | None
+    geometry_h: int | None
+    polygon_point_list: point_list_t | None
+    path_half_width: int | None
+    path_point_list: point_list_t | None
+    path_extension_start: pathextension_t | None
+    path_extension_end: pathextension_t | None
+    ctrapezoid_type: int | None
+    circle_radius: int | None
+    property_value_list: Sequence[property_value_t] | None
+    property_name: int | NString | None
+    property_is_standard: bool | None
+
+    _DEFAULTS: tuple[tuple[str, Any], ...] = (
+        ('placement_x', 0),
+        ('placement_y', 0),
+        ('text_x', 0),
+        ('text_y', 0),
+        ('geometry_x', 0),
+        ('geometry_y', 0),
+        ('xy_relative', False),
+        )
+    """Default values for modal variables which don't default to `None`"""
 
     def __init__(self) -> None:
         self.reset()
@@ -87,32 +121,19 @@ class Modals:
             `False` for xy_relative
             Undefined (`None`) for all others
         """
-        self.repetition = None
-        self.placement_x = 0
-        self.placement_y = 0
-        self.placement_cell = None
-        self.layer = None
-        self.datatype = None
-        self.text_layer = None
-        self.text_datatype = None
-        self.text_x = 0
-        self.text_y = 0
-        self.text_string = None
-        self.geometry_x = 0
-        self.geometry_y = 0
-        self.xy_relative = False
-        self.geometry_w = None
-        self.geometry_h = None
-        self.polygon_point_list = None
-        self.path_half_width = None
-        self.path_point_list = None
-        self.path_extension_start = None
-        self.path_extension_end = None
-        self.ctrapezoid_type = None
-        self.circle_radius = None
-        self.property_value_list = None
-        self.property_name = None
-        self.property_is_standard = None
+        for name in self.__slots__:
+            setattr(self, name, None)
+        for name, value in self._DEFAULTS:
+            setattr(self, name, value)
+
+
+# Padding for the End record: a zero-length bstring whose length is written
+#  with as many (redundant) continuation bytes as needed. Slice off the tail.
+_END_PADDING = b'\x80' * 255 + b'\x00'
+
+
+# Every record id is < 128 and so encodes to a single-byte uint
+_RECORD_ID_BYTES = [bytes((ii,)) for ii in range(128)]
 
 
 T = TypeVar('T')
@@ -132,6 +153,26 @@ class Record(metaclass=ABCMeta):
     """
     Common interface for records.
     """
+    __slots__ = ()
+
+    _MODAL_FIELDS: ClassVar[tuple[tuple[str, str], ...]] = ()
+    """
+    `(record_field, modal_field)` pairs which are always merged with
+     `adjust_field()` and deduplicated with `dedup_field()` semantics.
+    Subclasses which set this get `_merge_modal_fields()` and
+     `_dedup_modal_fields()` methods generated for them.
+    """
+
+    _merge_modal_fields: ClassVar[Callable[['Record', Modals], None]]
+    _dedup_modal_fields: ClassVar[Callable[['Record', Modals], None]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if '_MODAL_FIELDS' in cls.__dict__:
+            merge, dedup = _compile_modal_field_ops(cls._MODAL_FIELDS)
+            cls._merge_modal_fields = merge
+            cls._dedup_modal_fields = dedup
+
     @abstractmethod
     def merge_with_modals(self, modals: Modals) -> None:
         """
@@ -221,10 +262,31 @@ class Record(metaclass=ABCMeta):
         Returns:
             A deep copy of this record.
         """
-        return copy.deepcopy(self)
+        return self.__deepcopy__({})
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'Record':
+        # Generic fallback; most subclasses override this with an explicit
+        #  (and much faster) copy constructor.
+        new = object.__new__(type(self))
+        memo[id(self)] = new
+        for name, value in _attributes(self).items():
+            setattr(new, name, copy.deepcopy(value, memo))
+        return new
 
     def __repr__(self) -> str:
-        return f'{self.__class__}: ' + pprint.pformat(self.__dict__)
+        return f'{self.__class__}: ' + pprint.pformat(_attributes(self))
+
+
+def _attributes(obj: object) -> dict[str, Any]:
+    """
+    Collect an object's attributes, whether stored in `__slots__` or `__dict__`.
+    """
+    attrs = dict(getattr(obj, '__dict__', {}))
+    for cls in type(obj).__mro__:
+        for name in getattr(cls, '__slots__', ()):
+            if name != '__dict__' and hasattr(obj, name):
+                attrs[name] = getattr(obj, name)
+    return attrs
 
 
 class HasRepetition(Protocol):
@@ -240,6 +302,8 @@ class GeometryMixin(metaclass=ABCMeta):
     """
     Mixin defining common functions for geometry records
     """
+    __slots__ = ()
+
     x: int | None
     y: int | None
     layer: int | None
@@ -264,6 +328,196 @@ class GeometryMixin(metaclass=ABCMeta):
         return (self.get_layer(), self.get_datatype())
 
 
+def _copy_properties(properties: list['Property'], memo: dict[int, Any]) -> list['Property']:
+    return [prop.__deepcopy__(memo) for prop in properties]
+
+
+def _copy_point_list(point_list: point_list_t | None) -> point_list_t | None:
+    if point_list is None:
+        return None
+    if _USE_NUMPY and isinstance(point_list, numpy.ndarray):
+        return point_list.copy()
+    return [row[:] for row in point_list]     # type: ignore
+
+
+# Modal fields which only hold immutable values (ints, bools, or path extension
+#  tuples), so their values can be shared with records instead of copied.
+_SCALAR_MODALS = frozenset((
+    'layer', 'datatype', 'text_layer', 'text_datatype', 'geometry_w', 'geometry_h',
+    'circle_radius', 'path_half_width', 'ctrapezoid_type', 'property_is_standard',
+    'path_extension_start', 'path_extension_end',
+    ))
+
+
+def _compile_modal_field_ops(
+        fields: tuple[tuple[str, str], ...],
+        ) -> tuple[Callable[[Record, Modals], None], Callable[[Record, Modals], None]]:
+    """
+    Generate merge and dedup functions for a record's `_MODAL_FIELDS`.
+
+    The generated functions behave like a sequence of `adjust_field()` or
+     `dedup_field()` calls, but access each attribute directly instead of
+     via `getattr()`/`setattr()` on a field name.
+
+    Args:
+        fields: `(record_field, modal_field)` pairs.
+
+    Returns:
+        `(merge, dedup)` functions, each taking `(record, modals)`.
+    """
+    merge_lines = ['def merge(self, modals):']
+    dedup_lines = ['def dedup(self, modals):']
+    for r_field, m_field in fields:
+        filled = 'v' if m_field in _SCALAR_MODALS else 'copy.copy(v)'
+        merge_lines += [
+            f'    v = self.{r_field}',
+            '    if v is not None:',
+            f'        modals.{m_field} = v',
+            '    else:',
+            f'        v = modals.{m_field}',
+            '        if v is None:',
+            f"            raise InvalidDataError('Unfillable field: {m_field}')",
+            f'        self.{r_field} = {filled}',
+            ]
+
+        if m_field in ('polygon_point_list', 'path_point_list'):
+            equal = '_point_lists_equal(m, v)'
+        else:
+            equal = 'm is not None and m == v'
+        dedup_lines += [
+            f'    v = self.{r_field}',
+            f'    m = modals.{m_field}',
+            '    if v is not None:',
+            f'        if {equal}:',
+            f'            self.{r_field} = None',
+            '        else:',
+            f'            modals.{m_field} = v',
+            '    elif m is None:',
+            "        raise InvalidDataError('Unfillable field')",
+            ]
+
+    namespace: dict[str, Any] = {}
+    exec('\n'.join(merge_lines + [''] + dedup_lines), globals(), namespace)
+    return namespace['merge'], namespace['dedup']
+
+
+def _compile_coordinate_ops(
+        mx_field: str,
+        my_field: str,
+        ) -> tuple[Callable[[HasXY, Modals], None], Callable[[HasXY, Modals], None]]:
+    """
+    Generate specialized `adjust_coordinates()` and `dedup_coordinates()` functions
+     for a fixed pair of modal fields, so the modals are accessed directly instead of
+     via `getattr()`/`setattr()` on a field name.
+
+    Args:
+        mx_field: Attr of modals corresponding to `record.x`
+        my_field: Attr of modals corresponding to `record.y`
+
+    Returns:
+        `(adjust, dedup)` functions, each taking `(record, modals)`.
+    """
+    adjust_relative = []
+    adjust_absolute = []
+    for r_field, m_field in (('x', mx_field), ('y', my_field)):
+        adjust_relative += [
+            f'        if {r_field} is None:',
+            f'            record.{r_field} = modals.{m_field}',
+            '        else:',
+            f'            {r_field} += modals.{m_field}',
+            f'            record.{r_field} = {r_field}',
+            f'            modals.{m_field} = {r_field}',
+            ]
+        adjust_absolute += [
+            f'        if {r_field} is None:',
+            f'            record.{r_field} = modals.{m_field}',
+            '        else:',
+            f'            modals.{m_field} = {r_field}',
+            ]
+    adjust_lines = [
+        'def adjust(record, modals):',
+        '    x = record.x',
+        '    y = record.y',
+        '    if modals.xy_relative:',
+        *adjust_relative,
+        '    else:',
+        *adjust_absolute,
+        ]
+
+    dedup_relative = []
+    dedup_absolute = []
+    for r_field, m_field in (('x', mx_field), ('y', my_field)):
+        dedup_relative += [
+            f'        if {r_field} is not None:',
+            f'            record.{r_field} = {r_field} - modals.{m_field}',
+            f'            modals.{m_field} = {r_field}',
+            ]
+        dedup_absolute += [
+            f'        if {r_field} is not None:',
+            f'            if {r_field} == modals.{m_field}:',
+            f'                record.{r_field} = None',
+            '            else:',
+            f'                modals.{m_field} = {r_field}',
+            ]
+    dedup_lines = [
+        'def dedup(record, modals):',
+        '    x = record.x',
+        '    y = record.y',
+        '    if modals.xy_relative:',
+        *dedup_relative,
+        '    else:',
+        *dedup_absolute,
+        ]
+
+    namespace: dict[str, Any] = {}
+    exec('\n'.join(adjust_lines + [''] + dedup_lines), globals(), namespace)
+    return namespace['adjust'], namespace['dedup']
+
+
+_adjust_geometry_xy, _dedup_geometry_xy = _compile_coordinate_ops('geometry_x', 'geometry_y')
+_adjust_placement_xy, _dedup_placement_xy = _compile_coordinate_ops('placement_x', 'placement_y')
+_adjust_text_xy, _dedup_text_xy = _compile_coordinate_ops('text_x', 'text_y')
+
+# Single-field merge/dedup functions for fields whose use depends on the record's contents
+#  and so can't be listed in `_MODAL_FIELDS`.
+_merge_is_standard, _dedup_is_standard = _compile_modal_field_ops((('is_standard', 'property_is_standard'),))
+_merge_width, _dedup_width = _compile_modal_field_ops((('width', 'geometry_w'),))
+_merge_height, _dedup_height = _compile_modal_field_ops((('height', 'geometry_h'),))
+_merge_square_width, _dedup_square_width = _compile_modal_field_ops((('width', 'geometry_h'),))
+
+
+def _read_nothing(_stream: IO[bytes]) -> None:
+    return None
+
+
+# Readers for possibly-absent, possibly-referenced strings,
+#  keyed by (is_present, is_reference)
+_REFNAME_READERS: dict[tuple[bool, bool], Callable[[IO[bytes]], int | NString | None]] = {
+    (False, False): _read_nothing,
+    (False, True): _read_nothing,
+    (True, False): NString.read,
+    (True, True): read_uint,
+    }
+
+_REFSTRING_READERS: dict[tuple[bool, bool], Callable[[IO[bytes]], int | AString | None]] = {
+    (False, False): _read_nothing,
+    (False, True): _read_nothing,
+    (True, False): AString.read,
+    (True, True): read_uint,
+    }
+
+# Cell name and XName reference number readers, keyed by record id
+_CELL_NAME_READERS: dict[int, Callable[[IO[bytes]], int | NString]] = {
+    13: read_uint,
+    14: NString.read,
+    }
+
+_REFERENCE_NUMBER_READERS: dict[int, Callable[[IO[bytes]], int | None]] = {
+    30: _read_nothing,
+    31: read_uint,
+    }
+
+
 def read_refname(
         stream: IO[bytes],
         is_present: bool | int,
@@ -281,11 +535,7 @@ def read_refname(
     Returns:
         `None`, reference id, or `NString`
     """
-    if not is_present:
-        return None
-    if is_reference:
-        return read_uint(stream)
-    return NString.read(stream)
+    return _REFNAME_READERS[bool(is_present), bool(is_reference)](stream)
 
 
 def read_refstring(
@@ -305,39 +555,51 @@ def read_refstring(
     Returns:
         `None`, reference id, or `AString`
     """
-    if not is_present:
-        return None
-    if is_reference:
-        return read_uint(stream)
-    return AString.read(stream)
+    return _REFSTRING_READERS[bool(is_present), bool(is_reference)](stream)
+
+
+# Shared `merge_with_modals`/`deduplicate_with_modals` implementations for
+#  records which reset the modal variables or leave them untouched.
+def _reset_modals(_record: Record, modals: Modals) -> None:
+    modals.reset()
+
+
+def _ignore_modals(_record: Record, _modals: Modals) -> None:
+    pass
 
 
 class Pad(Record):
     """
     Pad record (ID 0)
     """
-    def merge_with_modals(self, modals: Modals) -> None:
-        pass
+    __slots__ = ()
 
-    def deduplicate_with_modals(self, modals: Modals) -> None:
-        pass
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'Pad':
+        return Pad()
+
+    merge_with_modals = _ignore_modals
+    deduplicate_with_modals = _ignore_modals
 
     @staticmethod
     def read(stream: IO[bytes], record_id: int) -> 'Pad':
         if record_id != 0:
             raise InvalidDataError(f'Invalid record id for Pad {record_id}')
         record = Pad()
-        logger.debug(f'Record ending at 0x{stream.tell():x}:\n {record}')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Record ending at 0x%x:\n %s', stream.tell(), record)
         return record
 
     def write(self, stream: IO[bytes]) -> int:
-        return write_uint(stream, 0)
+        stream.write(_RECORD_ID_BYTES[0])
+        return 1
 
 
 class XYMode(Record):
     """
     XYMode record (ID 15, 16)
     """
+    __slots__ = ('relative',)
+
     relative: bool
 
     @property
@@ -355,28 +617,36 @@ class XYMode(Record):
         """
         self.relative = relative
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'XYMode':
+        return XYMode(
+            relative=self.relative,
+            )
+
     def merge_with_modals(self, modals: Modals) -> None:
         modals.xy_relative = self.relative
 
-    def deduplicate_with_modals(self, modals: Modals) -> None:
-        pass
+    deduplicate_with_modals = _ignore_modals
 
     @staticmethod
     def read(stream: IO[bytes], record_id: int) -> 'XYMode':
         if record_id not in (15, 16):
             raise InvalidDataError('Invalid record id for XYMode')
         record = XYMode(record_id == 16)
-        logger.debug(f'Record ending at 0x{stream.tell():x}:\n {record}')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Record ending at 0x%x:\n %s', stream.tell(), record)
         return record
 
     def write(self, stream: IO[bytes]) -> int:
-        return write_uint(stream, 15 + self.relative)
+        stream.write(_RECORD_ID_BYTES[15 + self.relative])
+        return 1
 
 
 class Start(Record):
     """
     Start Record (ID 1)
     """
+    __slots__ = ('version', 'unit', 'offset_table')
+
     version: AString
     """File format version string"""
 
@@ -399,12 +669,8 @@ class Start(Record):
             offset_table: `OffsetTable` for the file, or `None` to place
                     it in the `End` record instead.
         """
-        if unit <= 0:
-            raise InvalidDataError(f'Non-positive unit: {unit}')
-        if math.isnan(unit):
-            raise InvalidDataError('NaN unit')
-        if math.isinf(unit):
-            raise InvalidDataError('Non-finite unit')
+        if not (unit > 0 and math.isfinite(unit)):
+            raise InvalidDataError(f'Unit must be positive and finite: {unit}')
         self.unit = unit
 
         if isinstance(version, AString):
@@ -416,11 +682,15 @@ class Start(Record):
             raise InvalidDataError(f'Invalid version string, only "1.0" is allowed: "{self.version.string}"')
         self.offset_table = offset_table
 
-    def merge_with_modals(self, modals: Modals) -> None:
-        modals.reset()
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'Start':
+        return Start(
+            unit=self.unit,
+            version=copy.deepcopy(self.version, memo),
+            offset_table=copy.deepcopy(self.offset_table, memo),
+            )
 
-    def deduplicate_with_modals(self, modals: Modals) -> None:
-        modals.reset()
+    merge_with_modals = _reset_modals
+    deduplicate_with_modals = _reset_modals
 
     @staticmethod
     def read(stream: IO[bytes], record_id: int) -> 'Start':
@@ -435,11 +705,13 @@ class Start(Record):
         else:
             offset_table = None
         record = Start(unit, version, offset_table)
-        logger.debug(f'Record ending at 0x{stream.tell():x}:\n {record}')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Record ending at 0x%x:\n %s', stream.tell(), record)
         return record
 
     def write(self, stream: IO[bytes]) -> int:
-        size = write_uint(stream, 1)
+        stream.write(_RECORD_ID_BYTES[1])
+        size = 1
         size += self.version.write(stream)
         size += write_real(stream, self.unit)
         size += write_uint(stream, self.offset_table is None)
@@ -454,6 +726,8 @@ class End(Record):
 
     The end record is always padded to a total length of 256 bytes.
     """
+    __slots__ = ('offset_table', 'validation')
+
     offset_table: OffsetTable | None
     """`None` if offset table was written into the `Start` record instead"""
 
@@ -474,11 +748,14 @@ class End(Record):
         self.validation = validation
         self.offset_table = offset_table
 
-    def merge_with_modals(self, modals: Modals) -> None:
-        pass
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'End':
+        return End(
+            validation=copy.deepcopy(self.validation, memo),
+            offset_table=copy.deepcopy(self.offset_table, memo),
+            )
 
-    def deduplicate_with_modals(self, modals: Modals) -> None:
-        pass
+    merge_with_modals = _ignore_modals
+    deduplicate_with_modals = _ignore_modals
 
     @staticmethod
     def read(
@@ -495,23 +772,20 @@ class End(Record):
         _padding_string = read_bstring(stream)      # noqa
         validation = Validation.read(stream)
         record = End(validation, offset_table)
-        logger.debug(f'Record ending at 0x{stream.tell():x}:\n {record}')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Record ending at 0x%x:\n %s', stream.tell(), record)
         return record
 
     def write(self, stream: IO[bytes]) -> int:
-        size = write_uint(stream, 2)
+        stream.write(_RECORD_ID_BYTES[2])
+        size = 1
         if self.offset_table is not None:
             size += self.offset_table.write(stream)
 
-        buf = io.BytesIO()
-        self.validation.write(buf)
-        validation_bytes = buf.getvalue()
-
-        pad_len = 256 - size - len(validation_bytes)
+        pad_len = 256 - size - self.validation.byte_length()
         if pad_len > 0:
-            pad = [0x80] * (pad_len - 1) + [0x00]
-            stream.write(bytes(pad))
-        stream.write(validation_bytes)
+            stream.write(_END_PADDING[-pad_len:])
+        self.validation.write(stream)
         return 256
 
 
@@ -519,6 +793,8 @@ class CBlock(Record):
     """
     CBlock (Compressed Block) record (ID 34)
     """
+    __slots__ = ('compression_type', 'decompressed_byte_count', 'compressed_bytes')
+
     compression_type: int
     """ `0` for zlib"""
 
@@ -547,11 +823,15 @@ class CBlock(Record):
         self.decompressed_byte_count = decompressed_byte_count
         self.compressed_bytes = compressed_bytes
 
-    def merge_with_modals(self, modals: Modals) -> None:
-        pass
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'CBlock':
+        return CBlock(
+            compression_type=self.compression_type,
+            decompressed_byte_count=self.decompressed_byte_count,
+            compressed_bytes=self.compressed_bytes,
+            )
 
-    def deduplicate_with_modals(self, modals: Modals) -> None:
-        pass
+    merge_with_modals = _ignore_modals
+    deduplicate_with_modals = _ignore_modals
 
     @staticmethod
     def read(stream: IO[bytes], record_id: int) -> 'CBlock':
@@ -561,11 +841,13 @@ class CBlock(Record):
         decompressed_count = read_uint(stream)
         compressed_bytes = read_bstring(stream)
         record = CBlock(compression_type, decompressed_count, compressed_bytes)
-        logger.debug(f'CBlock ending at 0x{stream.tell():x} was read successfully')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('CBlock ending at 0x%x was read successfully', stream.tell())
         return record
 
     def write(self, stream: IO[bytes]) -> int:
-        size = write_uint(stream, 34)
+        stream.write(_RECORD_ID_BYTES[34])
+        size = 1
         size += write_uint(stream, self.compression_type)
         size += write_uint(stream, self.decompressed_byte_count)
         size += write_bstring(stream, self.compressed_bytes)
@@ -584,6 +866,7 @@ class CBlock(Record):
             decompressed_bytes: Uncompressed data (one or more non-CBlock records)
             compression_type: Compression type (0: zlib). Default `0`
             compression_args: Passed as kwargs to `zlib.compressobj()`. Default `{}`.
+                If empty, the one-shot `zlib.compress()` is used instead.
 
         Returns:
             CBlock object constructed from the data.
@@ -596,20 +879,63 @@ class CBlock(Record):
 
         if compression_type == 0:
             count = len(decompressed_bytes)
-            compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS, **compression_args)
-            compressed_bytes = (compressor.compress(decompressed_bytes)
-                                + compressor.flush())
+            # A fresh compressor per block is deliberate: Compress.copy() of a
+            #  cached compressor is slower than constructing a new one.
+            if compression_args:
+                compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS, **compression_args)
+                compressed_bytes = compressor.compress(decompressed_bytes)
+                compressed_bytes += compressor.flush()
+            else:
+                compressed_bytes = zlib.compress(decompressed_bytes, wbits=-zlib.MAX_WBITS)
         else:
             raise InvalidDataError(f'Unknown compression type: {compression_type}')
 
         return CBlock(compression_type, count, compressed_bytes)
 
+    @staticmethod
+    def from_decompressed_many(
+            decompressed_blocks: Sequence[bytes],
+            compression_type: int = 0,
+            compression_args: dict[str, Any] | None = None,
+            max_workers: int | None = None,
+            ) -> list['CBlock']:
+        """
+        Create CBlock records from several independent chunks of uncompressed data,
+         compressing them concurrently.
+
+        Compression is done in a thread pool; `zlib` releases the GIL
+         while compressing, so this scales with the number of available cores.
+
+        Args:
+            decompressed_blocks: Uncompressed data for each CBlock.
+            compression_type: Compression type (0: zlib). Default `0`
+            compression_args: Passed to `from_decompressed()` for each block.
+            max_workers: Maximum number of worker threads. Default `None` lets
+                `ThreadPoolExecutor` decide.
+
+        Returns:
+            CBlock objects, in the same order as `decompressed_blocks`.
+
+        Raises:
+            InvalidDataError: if invalid `compression_type`.
+        """
+        if len(decompressed_blocks) < 2:
+            return [CBlock.from_decompressed(block, compression_type, compression_args)
+                    for block in decompressed_blocks]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda block: CBlock.from_decompressed(block, compression_type, compression_args),
+                decompressed_blocks,
+                ))
+
     def decompress(self, decompression_args: dict[str, Any] | None = None) -> bytes:
         """
         Decompress the contents of this CBlock.
 
         Args:
             decompression_args: Passed as kwargs to `zlib.decompressobj()`.
+                If empty (default), the one-shot `zlib.decompress()` is used instead.
 
         Returns:
             Decompressed `bytes` object.
@@ -618,23 +944,114 @@ class CBlock(Record):
             InvalidDataError: if data is malformed or compression type is
                     unknonwn.
         """
-        if decompression_args is None:
-            decompression_args = {}
         if self.compression_type == 0:
-            decompressor = zlib.decompressobj(wbits=-zlib.MAX_WBITS, **decompression_args)
-            decompressed_bytes = (decompressor.decompress(self.compressed_bytes)
-                                  + decompressor.flush())
+            if decompression_args:
+                decompressor = _inflate_zlib.decompressobj(wbits=-zlib.MAX_WBITS, **decompression_args)
+                decompressed_bytes = decompressor.decompress(self.compressed_bytes)
+                decompressed_bytes += decompressor.flush()
+            else:
+                # Size the output buffer up front so zlib doesn't have to grow it
+                decompressed_bytes = _inflate_zlib.decompress(
+                    self.compressed_bytes,
+                    wbits=-zlib.MAX_WBITS,
+                    bufsize=max(self.decompressed_byte_count, 1),
+                    )
             if len(decompressed_bytes) != self.decompressed_byte_count:
                 raise InvalidDataError('Decompressed data length does not match!')
         else:
             raise InvalidDataError(f'Unknown compression type: {self.compression_type}')
         return decompressed_bytes
 
+    def decompress_stream(
+            self,
+            chunk_size: int = 65536,
+            decompression_args: dict[str, Any] | None = None,
+            ) -> Iterator[bytes]:
+        """
+        Incrementally decompress the contents of this CBlock, so that the
+         full decompressed data never has to be held in memory at once.
+
+        Args:
+            chunk_size: Maximum number of decompressed bytes to produce per
+                step. Default 65536.
+            decompression_args: Passed as kwargs to `zlib.decompressobj()`.
+
+        Yields:
+            Successive chunks of decompressed data.
+
+        Raises:
+            InvalidDataError: if data is malformed or compression type is
+                    unknonwn.
+        """
+        if decompression_args is None:
+            decompression_args = {}
+        if self.compression_type != 0:
+            raise InvalidDataError(f'Unknown compression type: {self.compression_type}')
+
+        decompressor = _inflate_zlib.decompressobj(wbits=-zlib.MAX_WBITS, **decompression_args)
+        count = 0
+        data = self.compressed_bytes
+        # Keep going after the input is consumed, since the decompressor may
+        #  still be holding back output beyond `chunk_size`.
+        while not decompressor.eof:
+            chunk = decompressor.decompress(data, chunk_size)
+            data = decompressor.unconsumed_tail
+            if not chunk:
+                break       # truncated input; caught by the length check below
+            count += len(chunk)
+            yield chunk
+        chunk = decompressor.flush()
+        if chunk:
+            count += len(chunk)
+            yield chunk
+
+        if count != self.decompressed_byte_count:
+            raise InvalidDataError('Decompressed data length does not match!')
+
+
+class CBlockReader(io.RawIOBase):
+    """
+    Read-only file-like view of a `CBlock`'s decompressed contents,
+     which decompresses the data incrementally as it is read.
+
+    Wrap in an `io.BufferedReader` for efficient small reads.
+    """
+    _chunks: Iterator[bytes]
+    _pending: memoryview
+    _position: int
+
+    def __init__(self, cblock: CBlock, chunk_size: int = 65536) -> None:
+        """
+        Args:
+            cblock: The `CBlock` whose contents should be read.
+            chunk_size: Passed to `CBlock.decompress_stream()`.
+        """
+        self._chunks = cblock.decompress_stream(chunk_size)
+        self._pending = memoryview(b'')
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def readinto(self, buffer: Any) -> int:
+        if not self._pending:
+            self._pending = memoryview(next(self._chunks, b''))
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        self._position += size
+        return size
+
 
 class CellName(Record):
     """
     CellName record (ID 3, 4)
     """
+    __slots__ = ('nstring', 'reference_number')
+
     nstring: NString
     """name string"""
 
@@ -658,11 +1075,14 @@ class CellName(Record):
             self.nstring = NString(nstring)
         self.reference_number = reference_number
 
-    def merge_with_modals(self, modals: Modals) -> None:
-        modals.reset()
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'CellName':
+        return CellName(
+            nstring=copy.deepcopy(self.nstring, memo),
+            reference_number=self.reference_number,
+            )
 
-    def deduplicate_with_modals(self, modals: Modals) -> None:
-        modals.reset()
+    merge_with_modals = _reset_modals
+    deduplicate_with_modals = _reset_modals
 
     @staticmethod
     def read(stream: IO[bytes], record_id: int) -> 'CellName':
@@ -674,12 +1094,14 @@ class CellName(Record):
         else:
             reference_number = None
         record = CellName(nstring, reference_number)
-        logger.debug(f'Record ending at 0x{stream.tell():x}:\n {record}')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Record ending at 0x%x:\n %s', stream.tell(), record)
         return record
 
     def write(self, stream: IO[bytes]) -> int:
         record_id = 3 + (self.reference_number is not None)
-        size = write_uint(stream, record_id)
+        stream.write(_RECORD_ID_BYTES[record_id])
+        size = 1
         size += self.nstring.write(stream)
         if self.reference_number is not None:
             size += write_uint(stream, self.reference_number)
@@ -689,10 +1111,12 @@ class PropName(Record):
     """
     PropName record (ID 7, 8)
     """
+    __slots__ = ('nstring', 'reference_number')
+
     nstring: NString
     """name string"""
 
-    reference_number: int | None = None
+    reference_number: int | None
     """`None` results in implicit assignment"""
 
     def __init__(
@@ -712,11 +1136,14 @@ class PropName(Record):
             self.nstring = NString(nstring)
         self.reference_number = reference_number
 
-    def merge_with_modals(self, modals: Modals) -> None:
-        modals.reset()
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'PropName':
+        return PropName(
+            nstring=copy.deepcopy(self.nstring, memo),
+            reference_number=self.reference_number,
+            )
 
-    def deduplicate_with_modals(self, modals: Modals) -> None:
-        modals.reset()
+    merge_with_modals = _reset_modals
+    deduplicate_with_modals = _reset_modals
 
     @staticmethod
     def read(stream: IO[bytes], record_id: int) -> 'PropName':
@@ -728,12 +1155,14 @@ class PropName(Record):
         else:
             reference_number = None
         record = PropName(nstring, reference_number)
-        logger.debug(f'Record ending at 0x{stream.tell():x}:\n {record}')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Record ending at 0x%x:\n %s', stream.tell(), record)
         return record
 
     def write(self, stream: IO[bytes]) -> int:
         record_id = 7 + (self.reference_number is not None)
-        size = write_uint(stream, record_id)
+        stream.write(_RECORD_ID_BYTES[record_id])
+        size = 1
         size += self.nstring.write(stream)
         if self.reference_number is not None:
             size += write_uint(stream, self.reference_number)
@@ -744,10 +1173,12 @@ class TextString(Record):
     """
     TextString record (ID 5, 6)
     """
+    __slots__ = ('astring', 'reference_number')
+
     astring: AString
     """string contents"""
 
-    reference_number: int | None = None
+    reference_number: int | None
     """`None` results in implicit assignment"""
 
     def __init__(
@@ -767,11 +1198,14 @@ class TextString(Record):
             self.astring = AString(string)
         self.reference_number = reference_number
 
-    def merge_with_modals(self, modals: Modals) -> None:
-        modals.reset()
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'TextString':
+        return TextString(
+            string=copy.deepcopy(self.astring, memo),
+            reference_number=self.reference_number,
+            )
 
-    def deduplicate_with_modals(self, modals: Modals) -> None:
-        modals.reset()
+    merge_with_modals = _reset_modals
+    deduplicate_with_modals = _reset_modals
 
     @staticmethod
     def read(stream: IO[bytes], record_id: int) -> 'TextString':
@@ -783,12 +1217,14 @@ class TextString(Record):
         else:
             reference_number = None
         record = TextString(astring, reference_number)
-        logger.debug(f'Record ending at 0x{stream.tell():x}:\n {record}')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Record ending at 0x%x:\n %s', stream.tell(), record)
         return record
 
     def write(self, stream: IO[bytes]) -> int:
         record_id = 5 + (self.reference_number is not None)
-        size = write_uint(stream, record_id)
+        stream.write(_RECORD_ID_BYTES[record_id])
+        size = 1
         size += self.astring.write(stream)
         if self.reference_number is not None:
             size += write_uint(stream, self.reference_number)
@@ -799,6 +1235,8 @@ class PropString(Record):
     """
     PropString record (ID 9, 10)
     """
+    __slots__ = ('astring', 'reference_number')
+
     astring: AString
     """string contents"""
 
@@ -822,11 +1260,14 @@ class PropString(Record):
             self.astring = AString(string)
         self.reference_number = reference_number
 
-    def merge_with_modals(self, modals: Modals) -> None:
-        modals.reset()
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'PropString':
+        return PropString(
+            string=copy.deepcopy(self.astring, memo),
+            reference_number=self.reference_number,
+            )
 
-    def deduplicate_with_modals(self, modals: Modals) -> None:
-        modals.reset()
+    merge_with_modals = _reset_modals
+    deduplicate_with_modals = _reset_modals
 
     @staticmethod
     def read(stream: IO[bytes], record_id: int) -> 'PropString':
@@ -838,12 +1279,14 @@ class PropString(Record):
         else:
             reference_number = None
         record = PropString(astring, reference_number)
-        logger.debug(f'Record ending at 0x{stream.tell():x}:\n {record}')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Record ending at 0x%x:\n %s', stream.tell(), record)
         return record
 
     def write(self, stream: IO[bytes]) -> int:
         record_id = 9 + (self.reference_number is not None)
-        size = write_uint(stream, record_id)
+        stream.write(_RECORD_ID_BYTES[record_id])
+        size = 1
         size += self.astring.write(stream)
         if self.reference_number is not None:
             size += write_uint(stream, self.reference_number)
@@ -854,6 +1297,8 @@ class LayerName(Record):
     """
     LayerName record (ID 11, 12)
     """
+    __slots__ = ('nstring', 'layer_interval', 'type_interval', 'is_textlayer')
+
     nstring: NString
     """name string"""
 
@@ -888,11 +1333,16 @@ class LayerName(Record):
         self.type_interval = type_interval
         self.is_textlayer = is_textlayer
 
-    def merge_with_modals(self, modals: Modals) -> None:
-        modals.reset()
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'LayerName':
+        return LayerName(
+            nstring=copy.deepcopy(self.nstring, memo),
+            layer_interval=self.layer_interval,
+            type_interval=self.type_interval,
+            is_textlayer=self.is_textlayer,
+            )
 
-    def deduplicate_with_modals(self, modals: Modals) -> None:
-        modals.reset()
+    merge_with_modals = _reset_modals
+    deduplicate_with_modals = _reset_modals
 
     @staticmethod
     def read(stream: IO[bytes], record_id: int) -> 'LayerName':
@@ -903,12 +1353,14 @@ class LayerName(Record):
         layer_interval = read_interval(stream)
         type_interval = read_interval(stream)
         record = LayerName(nstring, layer_interval, type_interval, is_textlayer)
-        logger.debug(f'Record ending at 0x{stream.tell():x}:\n {record}')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Record ending at 0x%x:\n %s', stream.tell(), record)
         return record
 
     def write(self, stream: IO[bytes]) -> int:
         record_id = 11 + self.is_textlayer
-        size = write_uint(stream, record_id)
+        stream.write(_RECORD_ID_BYTES[record_id])
+        size = 1
         size += self.nstring.write(stream)
         size += write_interval(stream, *self.layer_interval)
         size += write_interval(stream, *self.type_interval)
@@ -919,6 +1371,9 @@ class Property(Record):
     """
     LayerName record (ID 28, 29)
     """
+    __slots__ = ('name', 'values', 'is_standard')
+    _MODAL_FIELDS = (('name', 'property_name'), ('values', 'property_value_list'))
+
     name: NString | int | None
     """`int` is an explicit reference, `None` is a flag to use Modal"""
     values: list[property_value_t] | None
@@ -928,7 +1383,7 @@ class Property(Record):
     def __init__(
             self,
             name: NString | str | int | None = None,
-            values: list[property_value_t] | None= None,
+            values: list[property_value_t] | None = None,
             is_standard: bool | None = None,
             ) -> None:
         """
@@ -947,6 +1402,28 @@ class Property(Record):
         self.values = values
         self.is_standard = is_standard
 
+    @staticmethod
+    def _new(
+            name: NString | int | None,
+            values: list[property_value_t] | None,
+            is_standard: bool | None,
+            ) -> 'Property':
+        """
+        Unchecked constructor for `read()`, which already produces `NString` names.
+        """
+        self = Property.__new__(Property)
+        self.name = name
+        self.values = values
+        self.is_standard = is_standard
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'Property':
+        return Property(
+            name=copy.deepcopy(self.name, memo),
+            values=copy.deepcopy(self.values, memo),
+            is_standard=self.is_standard,
+            )
+
     def get_name(self) -> NString | int:
         return verify_modal(self.name)  # type: ignore
 
@@ -957,15 +1434,13 @@ class Property(Record):
         return verify_modal(self.is_standard)
 
     def merge_with_modals(self, modals: Modals) -> None:
-        adjust_field(self, 'name', modals, 'property_name')
-        adjust_field(self, 'values', modals, 'property_value_list')
-        adjust_field(self, 'is_standard', modals, 'property_is_standard')
+        self._merge_modal_fields(modals)
+        _merge_is_standard(self, modals)
 
     def deduplicate_with_modals(self, modals: Modals) -> None:
-        dedup_field(self, 'name', modals, 'property_name')
-        dedup_field(self, 'values', modals, 'property_value_list')
+        self._dedup_modal_fields(modals)
         if self.values is None and self.name is None:
-            dedup_field(self, 'is_standard', modals, 'property_is_standard')
+            _dedup_is_standard(self, modals)
 
     @staticmethod
     def read(stream: IO[bytes], record_id: int) -> 'Property':
@@ -994,13 +1469,15 @@ class Property(Record):
 #                if uu != 0:
 #                    logger.warning('Malformed property record header; requested modal'
 #                                   ' values but had nonzero count. Ignoring count.')
-            record = Property(name, values, bool(ss))
-        logger.debug(f'Record ending at 0x{stream.tell():x}:\n {record}')
+            record = Property._new(name, values, bool(ss))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Record ending at 0x%x:\n %s', stream.tell(), record)
         return record
 
     def write(self, stream: IO[bytes]) -> int:
         if self.is_standard is None and self.values is None and self.name is None:
-            return write_uint(stream, 29)
+            stream.write(_RECORD_ID_BYTES[29])
+            return 1
 
         if self.is_standard is None:
             raise InvalidDataError('Property has value or name, but no is_standard flag!')
@@ -1014,11 +1491,11 @@ class Property(Record):
             uu = 0
 
         cc = self.name is not None
-        nn = cc and isinstance(self.name, int)
+        nn = cc and type(self.name) is int
         ss = self.is_standard
 
-        size = write_uint(stream, 28)
-        size += write_byte(stream, (uu << 4) | (vv << 3) | (cc << 2) | (nn << 1) | ss)
+        info = (uu << 4) | (vv << 3) | (cc << 2) | (nn << 1) | ss
+        size = stream.write(bytes((28, info)))
         if cc:
             if nn:
                 size += write_uint(stream, self.name)   # type: ignore
@@ -1035,6 +1512,8 @@ class XName(Record):
     """
     XName record (ID 30, 31)
     """
+    __slots__ = ('attribute', 'bstring', 'reference_number')
+
     attribute: int
     """Attribute number"""
 
@@ -1061,29 +1540,32 @@ class XName(Record):
         self.bstring = bstring
         self.reference_number = reference_number
 
-    def merge_with_modals(self, modals: Modals) -> None:
-        modals.reset()
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'XName':
+        return XName(
+            attribute=self.attribute,
+            bstring=self.bstring,
+            reference_number=self.reference_number,
+            )
 
-    def deduplicate_with_modals(self, modals: Modals) -> None:
-        modals.reset()
+    merge_with_modals = _reset_modals
+    deduplicate_with_modals = _reset_modals
 
     @staticmethod
     def read(stream: IO[bytes], record_id: int) -> 'XName':
-        if record_id not in (30, 31):
+        read_reference_number = _REFERENCE_NUMBER_READERS.get(record_id)
+        if read_reference_number is None:
             raise InvalidDataError(f'Invalid record id for XName: {record_id}')
         attribute = read_uint(stream)
         bstring = read_bstring(stream)
-        if record_id == 31:
-            reference_number: int | None = read_uint(stream)
-        else:
-            reference_number = None
-        record = XName(attribute, bstring, reference_number)
-        logger.debug(f'Record ending at 0x{stream.tell():x}:\n {record}')
+        record = XName(attribute, bstring, read_reference_number(stream))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Record ending at 0x%x:\n %s', stream.tell(), record)
         return record
 
     def write(self, stream: IO[bytes]) -> int:
         record_id = 30 + (self.reference_number is not None)
-        size = write_uint(stream, record_id)
+        stream.write(_RECORD_ID_BYTES[record_id])
+        size = 1
         size += write_uint(stream, self.attribute)
         size += write_bstring(stream, self.bstring)
         if self.reference_number is not None:
@@ -1095,6 +1577,8 @@ class XElement(Record):
     """
     XElement record (ID 32)
     """
+    __slots__ = ('attribute', 'bstring', 'properties')
+
     attribute: int
     """Attribute number"""
 
@@ -1119,11 +1603,15 @@ class XElement(Record):
         self.bstring = bstring
         self.properties = [] if properties is None else properties
 
-    def merge_with_modals(self, modals: Modals) -> None:
-        pass
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'XElement':
+        return XElement(
+            attribute=self.attribute,
+            bstring=self.bstring,
+            properties=_copy_properties(self.properties, memo),
+            )
 
-    def deduplicate_with_modals(self, modals: Modals) -> None:
-        pass
+    merge_with_modals = _ignore_modals
+    deduplicate_with_modals = _ignore_modals
 
     @staticmethod
     def read(stream: IO[bytes], record_id: int) -> 'XElement':
@@ -1132,11 +1620,13 @@ class XElement(Record):
         attribute = read_uint(stream)
         bstring = read_bstring(stream)
         record = XElement(attribute, bstring)
-        logger.debug(f'Record ending at 0x{stream.tell():x}:\n {record}')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Record ending at 0x%x:\n %s', stream.tell(), record)
         return record
 
     def write(self, stream: IO[bytes]) -> int:
-        size = write_uint(stream, 32)
+        stream.write(_RECORD_ID_BYTES[32])
+        size = 1
         size += write_uint(stream, self.attribute)
         size += write_bstring(stream, self.bstring)
         return size
@@ -1146,17 +1636,20 @@ class XGeometry(Record, GeometryMixin):
     """
     XGeometry record (ID 33)
     """
+    __slots__ = ('attribute', 'bstring', 'layer', 'datatype', 'x', 'y', 'repetition', 'properties')
+    _MODAL_FIELDS = (('layer', 'layer'), ('datatype', 'datatype'))
+
     attribute: int
     """Attribute number"""
 
     bstring: bytes
     """XGeometry data"""
 
-    layer: int | None = None
-    datatype: int | None = None
-    x: int | None = None
-    y: int | None = None
-    repetition: repetition_t | None = None
+    layer: int | None
+    datatype: int | None
+    x: int | None
+    y: int | None
+    repetition: repetition_t | None
     properties: list['Property']
 
     def __init__(
@@ -1191,41 +1684,34 @@ class XGeometry(Record, GeometryMixin):
         self.properties = [] if properties is None else properties
 
     def merge_with_modals(self, modals: Modals) -> None:
-        adjust_coordinates(self, modals, 'geometry_x', 'geometry_y')
+        _adjust_geometry_xy(self, modals)
         adjust_repetition(self, modals)
-        adjust_field(self, 'layer', modals, 'layer')
-        adjust_field(self, 'datatype', modals, 'datatype')
+        self._merge_modal_fields(modals)
 
     def deduplicate_with_modals(self, modals: Modals) -> None:
-        dedup_coordinates(self, modals, 'geometry_x', 'geometry_y')
+        _dedup_geometry_xy(self, modals)
         dedup_repetition(self, modals)
-        dedup_field(self, 'layer', modals, 'layer')
-        dedup_field(self, 'datatype', modals, 'datatype')
+        self._dedup_modal_fields(modals)
 
     @staticmethod
     def read(stream: IO[bytes], record_id: int) -> 'XGeometry':
         if record_id != 33:
             raise InvalidDataError(f'Invalid record id for XGeometry: {record_id}')
 
-        z0, z1, z2, xx, yy, rr, dd, ll = read_bool_byte(stream)
-        if z0 or z1 or z2:
+        byte = read_byte(stream)      # 000XYRDL
+        if byte & 0xe0:
             raise InvalidDataError('Malformed XGeometry header')
         attribute = read_uint(stream)
-        optional: dict[str, Any] = {}
-        if ll:
-            optional['layer'] = read_uint(stream)
-        if dd:
-            optional['datatype'] = read_uint(stream)
+        layer = read_uint(stream) if byte & 0x01 else None
+        datatype = read_uint(stream) if byte & 0x02 else None
         bstring = read_bstring(stream)
-        if xx:
-            optional['x'] = read_sint(stream)
-        if yy:
-            optional['y'] = read_sint(stream)
-        if rr:
-            optional['repetition'] = read_repetition(stream)
+        x = read_sint(stream) if byte & 0x10 else None
+        y = read_sint(stream) if byte & 0x08 else None
+        repetition = read_repetition(stream) if byte & 0x04 else None
 
-        record = XGeometry(attribute, bstring, **optional)
-        logger.debug(f'Record ending at 0x{stream.tell():x}:\n {record}')
+        record = XGeometry(attribute, bstring, layer, datatype, x, y, repetition)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Record ending at 0x%x:\n %s', stream.tell(), record)
         return record
 
     def write(self, stream: IO[bytes]) -> int:
@@ -1235,8 +1721,8 @@ class XGeometry(Record, GeometryMixin):
         dd = self.datatype is not None
         ll = self.layer is not None
 
-        size = write_uint(stream, 33)
-        size += write_bool_byte(stream, (0, 0, 0, xx, yy, rr, dd, ll))
+        info = (xx << 4) | (yy << 3) | (rr << 2) | (dd << 1) | ll     # 000XYRDL
+        size = stream.write(bytes((33, info)))
         size += write_uint(stream, self.attribute)
         if ll:
             size += write_uint(stream, self.layer)      # type: ignore
@@ -1256,6 +1742,8 @@ class Cell(Record):
     """
     Cell record (ID 13, 14)
     """
+    __slots__ = ('name',)
+
     name: int | NString
     """int specifies "CellName reference" number"""
 
@@ -1266,32 +1754,33 @@ class Cell(Record):
         """
         self.name = name if isinstance(name, int | NString) else NString(name)
 
-    def merge_with_modals(self, modals: Modals) -> None:
-        modals.reset()
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'Cell':
+        return Cell(
+            name=copy.deepcopy(self.name, memo),
+            )
 
-    def deduplicate_with_modals(self, modals: Modals) -> None:
-        modals.reset()
+    merge_with_modals = _reset_modals
+    deduplicate_with_modals = _reset_modals
 
     @staticmethod
     def read(stream: IO[bytes], record_id: int) -> 'Cell':
-        name: int | NString
-        if record_id == 13:
-            name = read_uint(stream)
-        elif record_id == 14:
-            name = NString.read(stream)
-        else:
+        read_name = _CELL_NAME_READERS.get(record_id)
+        if read_name is None:
             raise InvalidDataError(f'Invalid record id for Cell: {record_id}')
-        record = Cell(name)
-        logger.debug(f'Record ending at 0x{stream.tell():x}:\n {record}')
+        record = Cell(read_name(stream))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Record ending at 0x%x:\n %s', stream.tell(), record)
         return record
 
     def write(self, stream: IO[bytes]) -> int:
         size = 0
-        if isinstance(self.name, int):
-            size += write_uint(stream, 13)
+        if type(self.name) is int:
+            stream.write(_RECORD_ID_BYTES[13])
+            size += 1
             size += write_uint(stream, self.name)
         else:
-            size += write_uint(stream, 14)
+            stream.write(_RECORD_ID_BYTES[14])
+            size += 1
             size += self.name.write(stream)
         return size
 
@@ -1300,18 +1789,21 @@ class Placement(Record):
     """
     Placement record (ID 17, 18)
     """
-    name: int | NString | None = None
+    __slots__ = ('name', 'magnification', 'angle', 'x', 'y', 'repetition', 'flip', 'properties')
+    _MODAL_FIELDS = (('name', 'placement_cell'),)
+
+    name: int | NString | None
     """name, "CellName reference" number, or reuse modal"""
 
-    magnification: real_t | None = None
+    magnification: real_t | None
     """magnification factor"""
 
-    angle: real_t | None = None
+    angle: real_t | None
     """Rotation, degrees counterclockwise"""
 
-    x: int | None = None
-    y: int | None = None
-    repetition: repetition_t | None = None
+    x: int | None
+    y: int | None
+    repetition: repetition_t | None
     flip: bool
     """Whether to perform reflection about the x-axis"""
 
@@ -1353,6 +1845,18 @@ class Placement(Record):
             self.name = NString(name)
         self.properties = [] if properties is None else properties
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'Placement':
+        return Placement(
+            flip=self.flip,
+            name=copy.deepcopy(self.name, memo),
+            magnification=self.magnification,
+            angle=self.angle,
+            x=self.x,
+            y=self.y,
+            repetition=copy.deepcopy(self.repetition, memo),
+            properties=_copy_properties(self.properties, memo),
+            )
+
     def get_name(self) -> NString | int:
         return verify_modal(self.name)  # type: ignore
 
@@ -1363,70 +1867,63 @@ class Placement(Record):
         return verify_modal(self.y)
 
     def merge_with_modals(self, modals: Modals) -> None:
-        adjust_coordinates(self, modals, 'placement_x', 'placement_y')
+        _adjust_placement_xy(self, modals)
         adjust_repetition(self, modals)
-        adjust_field(self, 'name', modals, 'placement_cell')
+        self._merge_modal_fields(modals)
 
     def deduplicate_with_modals(self, modals: Modals) -> None:
-        dedup_coordinates(self, modals, 'placement_x', 'placement_y')
+        _dedup_placement_xy(self, modals)
         dedup_repetition(self, modals)
-        dedup_field(self, 'name', modals, 'placement_cell')
+        self._dedup_modal_fields(modals)
 
     @staticmethod
     def read(stream: IO[bytes], record_id: int) -> 'Placement':
         if record_id not in (17, 18):
             raise InvalidDataError(f'Invalid record id for Placement: {record_id}')
 
-        #CNXYRAAF (17) or CNXYRMAF (18)
-        cc, nn, xx, yy, rr, ma0, ma1, flip = read_bool_byte(stream)
+        byte = read_byte(stream)      # CNXYRAAF (17) or CNXYRMAF (18)
 
-        optional: dict[str, Any] = {}
-        name = read_refname(stream, cc, nn)
+        name = read_refname(stream, byte >> 7, (byte >> 6) & 0x01)
+        magnification: real_t | None
+        angle: real_t | None
         if record_id == 17:
-            aa = int((ma0 << 1) | ma1)
-            optional['angle'] = aa * 90
-        elif record_id == 18:
-            mm = ma0
-            aa1 = ma1
-            if mm:
-                optional['magnification'] = read_real(stream)
-            if aa1:
-                optional['angle'] = read_real(stream)
-        if xx:
-            optional['x'] = read_sint(stream)
-        if yy:
-            optional['y'] = read_sint(stream)
-        if rr:
-            optional['repetition'] = read_repetition(stream)
-
-        record = Placement(flip, name, **optional)
-        logger.debug(f'Record ending at 0x{stream.tell():x}:\n {record}')
+            magnification = None
+            angle = ((byte >> 1) & 0x03) * 90
+        else:
+            magnification = read_real(stream) if byte & 0x04 else None
+            angle = read_real(stream) if byte & 0x02 else None
+        x = read_sint(stream) if byte & 0x20 else None
+        y = read_sint(stream) if byte & 0x10 else None
+        repetition = read_repetition(stream) if byte & 0x08 else None
+
+        record = Placement(bool(byte & 0x01), name, magnification, angle, x, y, repetition)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Record ending at 0x%x:\n %s', stream.tell(), record)
         return record
 
     def write(self, stream: IO[bytes]) -> int:
         cc = self.name is not None
-        nn = cc and isinstance(self.name, int)
+        nn = cc and type(self.name) is int
         xx = self.x is not None
         yy = self.y is not None
         rr = self.repetition is not None
         ff = self.flip
 
-        if (self.magnification == 1
+        if ((self.magnification is None or self.magnification == 1)
                 and self.angle is not None
                 and abs(self.angle % 90.0) < 1e-14):
             aa = int((self.angle / 90) % 4.0)
-            bools = (cc, nn, xx, yy, rr, aa & 0b10, aa & 0b01, ff)
+            byte = (cc << 7) | (nn << 6) | (xx << 5) | (yy << 4) | (rr << 3) | (aa << 1) | ff
             mm = False
             aq = False
             record_id = 17
         else:
             mm = self.magnification is not None
             aq = self.angle is not None
-            bools = (cc, nn, xx, yy, rr, mm, aq, ff)
+            byte = (cc << 7) | (nn << 6) | (xx << 5) | (yy << 4) | (rr << 3) | (mm << 2) | (aq << 1) | ff
             record_id = 18
 
-        size = write_uint(stream, record_id)
-        size += write_bool_byte(stream, bools)
+        size = stream.write(bytes((record_id, byte)))
         if cc:
             if nn:
                 size += write_uint(stream, self.name)       # type: ignore
@@ -1434,7 +1931,7 @@ class Placement(Record):
                 size += self.name.write(stream)             # type: ignore
         if mm:
             size += write_real(stream, self.magnification)  # type: ignore
-        if aa:
+        if aq:
             size += write_real(stream, self.angle)          # type: ignore
         if xx:
             size += write_sint(stream, self.x)              # type: ignore
@@ -1449,12 +1946,19 @@ class Text(Record, GeometryMixin):
     """
     Text record (ID 19)
     """
-    string: AString | int | None = None
-    layer: int | None = None
-    datatype: int | None = None
-    x: int | None = None
-    y: int | None = None
-    repetition: repetition_t | None = None
+    __slots__ = ('string', 'layer', 'datatype', 'x', 'y', 'repetition', 'properties')
+    _MODAL_FIELDS = (
+        ('string', 'text_string'),
+        ('layer', 'text_layer'),
+        ('datatype', 'text_datatype'),
+        )
+
+    string: AString | int | None
+    layer: int | None
+    datatype: int | None
+    x: int | None
+    y: int | None
+    repetition: repetition_t | None
     properties: list['Property']
 
     def __init__(
@@ -1489,60 +1993,62 @@ class Text(Record, GeometryMixin):
             self.string = AString(string)
         self.properties = [] if properties is None else properties
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'Text':
+        return Text(
+            string=copy.deepcopy(self.string, memo),
+            layer=self.layer,
+            datatype=self.datatype,
+            x=self.x,
+            y=self.y,
+            repetition=copy.deepcopy(self.repetition, memo),
+            properties=_copy_properties(self.properties, memo),
+            )
+
     def get_string(self) -> AString | int:
         return verify_modal(self.string)          # type: ignore
 
     def merge_with_modals(self, modals: Modals) -> None:
-        adjust_coordinates(self, modals, 'text_x', 'text_y')
+        _adjust_text_xy(self, modals)
         adjust_repetition(self, modals)
-        adjust_field(self, 'string', modals, 'text_string')
-        adjust_field(self, 'layer', modals, 'text_layer')
-        adjust_field(self, 'datatype', modals, 'text_datatype')
+        self._merge_modal_fields(modals)
 
     def deduplicate_with_modals(self, modals: Modals) -> None:
-        dedup_coordinates(self, modals, 'text_x', 'text_y')
+        _dedup_text_xy(self, modals)
         dedup_repetition(self, modals)
-        dedup_field(self, 'string', modals, 'text_string')
-        dedup_field(self, 'layer', modals, 'text_layer')
-        dedup_field(self, 'datatype', modals, 'text_datatype')
+        self._dedup_modal_fields(modals)
 
     @staticmethod
     def read(stream: IO[bytes], record_id: int) -> 'Text':
         if record_id != 19:
             raise InvalidDataError(f'Invalid record id for Text: {record_id}')
 
-        z0, cc, nn, xx, yy, rr, dd, ll = read_bool_byte(stream)
-        if z0:
+        byte = read_byte(stream)      # 0CNXYRTL
+        if byte & 0x80:
             raise InvalidDataError('Malformed Text header')
 
-        optional: dict[str, Any] = {}
-        string = read_refstring(stream, cc, nn)
-        if ll:
-            optional['layer'] = read_uint(stream)
-        if dd:
-            optional['datatype'] = read_uint(stream)
-        if xx:
-            optional['x'] = read_sint(stream)
-        if yy:
-            optional['y'] = read_sint(stream)
-        if rr:
-            optional['repetition'] = read_repetition(stream)
+        string = read_refstring(stream, (byte >> 6) & 0x01, (byte >> 5) & 0x01)
+        layer = read_uint(stream) if byte & 0x01 else None
+        datatype = read_uint(stream) if byte & 0x02 else None
+        x = read_sint(stream) if byte & 0x10 else None
+        y = read_sint(stream) if byte & 0x08 else None
+        repetition = read_repetition(stream) if byte & 0x04 else None
 
-        record = Text(string, **optional)
-        logger.debug(f'Record ending at 0x{stream.tell():x}:\n {record}')
+        record = Text(string, layer, datatype, x, y, repetition)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Record ending at 0x%x:\n %s', stream.tell(), record)
         return record
 
     def write(self, stream: IO[bytes]) -> int:
         cc = self.string is not None
-        nn = cc and isinstance(self.string, int)
+        nn = cc and type(self.string) is int
         xx = self.x is not None
         yy = self.y is not None
         rr = self.repetition is not None
         dd = self.datatype is not None
         ll = self.layer is not None
 
-        size = write_uint(stream, 19)
-        size += write_bool_byte(stream, (0, cc, nn, xx, yy, rr, dd, ll))
+        info = (cc << 6) | (nn << 5) | (xx << 4) | (yy << 3) | (rr << 2) | (dd << 1) | ll     # 0CNXYRTL
+        size = stream.write(bytes((19, info)))
         if cc:
             if nn:
                 size += write_uint(stream, self.string)  # type: ignore
@@ -1567,6 +2073,12 @@ class Rectangle(Record, GeometryMixin):
 
     (x, y) denotes the lower-left (min-x, min-y) corner of the rectangle.
     """
+    __slots__ = (
+        'layer', 'datatype', 'width', 'height', 'x', 'y', 'repetition', 'is_square',
+        'properties',
+        )
+    _MODAL_FIELDS = (('layer', 'layer'), ('datatype', 'datatype'), ('width', 'geometry_w'))
+
     layer: int | None
     datatype: int | None
     width: int | None
@@ -1616,6 +2128,45 @@ class Rectangle(Record, GeometryMixin):
             raise InvalidDataError('Rectangle is square and also has height')
         self.properties = [] if properties is None else properties
 
+    @staticmethod
+    def _new(
+            is_square: bool,
+            layer: int | None,
+            datatype: int | None,
+            width: int | None,
+            height: int | None,
+            x: int | None,
+            y: int | None,
+            repetition: repetition_t | None,
+            ) -> 'Rectangle':
+        """
+        Unchecked constructor for `read()`, which has already validated the fields.
+        """
+        self = Rectangle.__new__(Rectangle)
+        self.is_square = is_square
+        self.layer = layer
+        self.datatype = datatype
+        self.width = width
+        self.height = height
+        self.x = x
+        self.y = y
+        self.repetition = repetition
+        self.properties = []
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'Rectangle':
+        return Rectangle(
+            is_square=self.is_square,
+            width=self.width,
+            height=self.height,
+            layer=self.layer,
+            datatype=self.datatype,
+            x=self.x,
+            y=self.y,
+            repetition=copy.deepcopy(self.repetition, memo),
+            properties=_copy_properties(self.properties, memo),
+            )
+
     def get_width(self) -> int:
         return verify_modal(self.width)
 
@@ -1625,50 +2176,41 @@ class Rectangle(Record, GeometryMixin):
         return verify_modal(self.height)
 
     def merge_with_modals(self, modals: Modals) -> None:
-        adjust_coordinates(self, modals, 'geometry_x', 'geometry_y')
+        _adjust_geometry_xy(self, modals)
         adjust_repetition(self, modals)
-        adjust_field(self, 'layer', modals, 'layer')
-        adjust_field(self, 'datatype', modals, 'datatype')
-        adjust_field(self, 'width', modals, 'geometry_w')
+        self._merge_modal_fields(modals)
         if self.is_square:
-            adjust_field(self, 'width', modals, 'geometry_h')
+            _merge_square_width(self, modals)
         else:
-            adjust_field(self, 'height', modals, 'geometry_h')
+            _merge_height(self, modals)
 
     def deduplicate_with_modals(self, modals: Modals) -> None:
-        dedup_coordinates(self, modals, 'geometry_x', 'geometry_y')
+        _dedup_geometry_xy(self, modals)
         dedup_repetition(self, modals)
-        dedup_field(self, 'layer', modals, 'layer')
-        dedup_field(self, 'datatype', modals, 'datatype')
-        dedup_field(self, 'width', modals, 'geometry_w')
+        self._dedup_modal_fields(modals)
         if self.is_square:
-            dedup_field(self, 'width', modals, 'geometry_h')
+            _dedup_square_width(self, modals)
         else:
-            dedup_field(self, 'height', modals, 'geometry_h')
+            _dedup_height(self, modals)
 
     @staticmethod
     def read(stream: IO[bytes], record_id: int) -> 'Rectangle':
         if record_id != 20:
             raise InvalidDataError(f'Invalid record id for Rectangle: {record_id}')
 
-        is_square, ww, hh, xx, yy, rr, dd, ll = read_bool_byte(stream)
-        optional: dict[str, Any] = {}
-        if ll:
-            optional['layer'] = read_uint(stream)
-        if dd:
-            optional['datatype'] = read_uint(stream)
-        if ww:
-            optional['width'] = read_uint(stream)
-        if hh:
-            optional['height'] = read_uint(stream)
-        if xx:
-            optional['x'] = read_sint(stream)
-        if yy:
-            optional['y'] = read_sint(stream)
-        if rr:
-            optional['repetition'] = read_repetition(stream)
-        record = Rectangle(is_square, **optional)
-        logger.debug(f'Record ending at 0x{stream.tell():x}:\n {record}')
+        byte = read_byte(stream)      # SWHXYRDL
+        if byte & 0xa0 == 0xa0:
+            raise InvalidDataError('Rectangle is square and also has height')
+        layer = read_uint(stream) if byte & 0x01 else None
+        datatype = read_uint(stream) if byte & 0x02 else None
+        width = read_uint(stream) if byte & 0x40 else None
+        height = read_uint(stream) if byte & 0x20 else None
+        x = read_sint(stream) if byte & 0x10 else None
+        y = read_sint(stream) if byte & 0x08 else None
+        repetition = read_repetition(stream) if byte & 0x04 else None
+        record = Rectangle._new(bool(byte & 0x80), layer, datatype, width, height, x, y, repetition)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Record ending at 0x%x:\n %s', stream.tell(), record)
         return record
 
     def write(self, stream: IO[bytes]) -> int:
@@ -1681,8 +2223,8 @@ class Rectangle(Record, GeometryMixin):
         dd = self.datatype is not None
         ll = self.layer is not None
 
-        size = write_uint(stream, 20)
-        size += write_bool_byte(stream, (ss, ww, hh, xx, yy, rr, dd, ll))
+        info = (ss << 7) | (ww << 6) | (hh << 5) | (xx << 4) | (yy << 3) | (rr << 2) | (dd << 1) | ll     # SWHXYRDL
+        size = stream.write(bytes((20, info)))
         if ll:
             size += write_uint(stream, self.layer)      # type: ignore
         if dd:
@@ -1704,6 +2246,13 @@ class Polygon(Record, GeometryMixin):
     """
     Polygon record (ID 21)
     """
+    __slots__ = ('layer', 'datatype', 'x', 'y', 'repetition', 'point_list', 'properties')
+    _MODAL_FIELDS = (
+        ('layer', 'layer'),
+        ('datatype', 'datatype'),
+        ('point_list', 'polygon_point_list'),
+        )
+
     layer: int | None
     datatype: int | None
     x: int | None
@@ -1747,85 +2296,141 @@ class Polygon(Record, GeometryMixin):
         if point_list is not None and len(point_list) < 3:
             warn('Polygon with < 3 points', stacklevel=2)
 
+    @staticmethod
+    def _new(
+            point_list: point_list_t | None,
+            layer: int | None,
+            datatype: int | None,
+            x: int | None,
+            y: int | None,
+            repetition: repetition_t | None,
+            ) -> 'Polygon':
+        """
+        Unchecked constructor for `read()`, which has already validated the fields.
+        """
+        self = Polygon.__new__(Polygon)
+        self.layer = layer
+        self.datatype = datatype
+        self.x = x
+        self.y = y
+        self.repetition = repetition
+        self.point_list = point_list
+        self.properties = []
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'Polygon':
+        return Polygon(
+            point_list=_copy_point_list(self.point_list),
+            layer=self.layer,
+            datatype=self.datatype,
+            x=self.x,
+            y=self.y,
+            repetition=copy.deepcopy(self.repetition, memo),
+            properties=_copy_properties(self.properties, memo),
+            )
+
     def get_point_list(self) -> point_list_t:
         return verify_modal(self.point_list)
 
     def merge_with_modals(self, modals: Modals) -> None:
-        adjust_coordinates(self, modals, 'geometry_x', 'geometry_y')
+        _adjust_geometry_xy(self, modals)
         adjust_repetition(self, modals)
-        adjust_field(self, 'layer', modals, 'layer')
-        adjust_field(self, 'datatype', modals, 'datatype')
-        adjust_field(self, 'point_list', modals, 'polygon_point_list')
+        self._merge_modal_fields(modals)
 
     def deduplicate_with_modals(self, modals: Modals) -> None:
-        dedup_coordinates(self, modals, 'geometry_x', 'geometry_y')
+        _dedup_geometry_xy(self, modals)
         dedup_repetition(self, modals)
-        dedup_field(self, 'layer', modals, 'layer')
-        dedup_field(self, 'datatype', modals, 'datatype')
-        dedup_field(self, 'point_list', modals, 'polygon_point_list')
+        self._dedup_modal_fields(modals)
 
     @staticmethod
     def read(stream: IO[bytes], record_id: int) -> 'Polygon':
         if record_id != 21:
             raise InvalidDataError(f'Invalid record id for Polygon: {record_id}')
 
-        z0, z1, pp, xx, yy, rr, dd, ll = read_bool_byte(stream)
-        if z0 or z1:
+        byte = read_byte(stream)      # 00PXYRDL
+        if byte & 0xc0:
             raise InvalidDataError('Invalid polygon header')
 
-        optional: dict[str, Any] = {}
-        if ll:
-            optional['layer'] = read_uint(stream)
-        if dd:
-            optional['datatype'] = read_uint(stream)
-        if pp:
-            optional['point_list'] = read_point_list(stream, implicit_closed=True)
-        if xx:
-            optional['x'] = read_sint(stream)
-        if yy:
-            optional['y'] = read_sint(stream)
-        if rr:
-            optional['repetition'] = read_repetition(stream)
-        record = Polygon(**optional)
-        logger.debug('Record ending at 0x{stream.tell():x}:\n {record}')
+        layer = read_uint(stream) if byte & 0x01 else None
+        datatype = read_uint(stream) if byte & 0x02 else None
+        point_list = read_point_list(stream, implicit_closed=True) if byte & 0x20 else None
+        if point_list is not None and len(point_list) < 3:
+            warn('Polygon with < 3 points', stacklevel=2)
+        x = read_sint(stream) if byte & 0x10 else None
+        y = read_sint(stream) if byte & 0x08 else None
+        repetition = read_repetition(stream) if byte & 0x04 else None
+        record = Polygon._new(point_list, layer, datatype, x, y, repetition)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Record ending at 0x%x:\n %s', stream.tell(), record)
         return record
 
     def write(self, stream: IO[bytes], fast: bool = False) -> int:
-        pp = self.point_list is not None
-        xx = self.x is not None
-        yy = self.y is not None
-        rr = self.repetition is not None
-        dd = self.datatype is not None
-        ll = self.layer is not None
-
-        size = write_uint(stream, 21)
-        size += write_bool_byte(stream, (0, 0, pp, xx, yy, rr, dd, ll))
-        if ll:
-            size += write_uint(stream, self.layer)          # type: ignore
-        if dd:
-            size += write_uint(stream, self.datatype)       # type: ignore
-        if pp:
-            size += write_point_list(stream, self.point_list,   # type: ignore
-                                     implicit_closed=True, fast=fast)
-        if xx:
-            size += write_sint(stream, self.x)      # type: ignore
-        if yy:
-            size += write_sint(stream, self.y)      # type: ignore
-        if rr:
-            size += self.repetition.write(stream)   # type: ignore
+        layer = self.layer
+        datatype = self.datatype
+        point_list = self.point_list
+        x = self.x
+        y = self.y
+        repetition = self.repetition
+        pp = point_list is not None
+        xx = x is not None
+        yy = y is not None
+        rr = repetition is not None
+        dd = datatype is not None
+        ll = layer is not None
+
+        info = (pp << 5) | (xx << 4) | (yy << 3) | (rr << 2) | (dd << 1) | ll     # 00PXYRDL
+        if layer is not None and datatype is not None and 0 <= layer < 0x80 and 0 <= datatype < 0x80:
+            # Common case: record id, info byte, layer and datatype are all single bytes
+            size = stream.write(bytes((21, info, layer, datatype)))
+        else:
+            size = stream.write(bytes((21, info)))
+            if layer is not None:
+                size += write_uint(stream, layer)
+            if datatype is not None:
+                size += write_uint(stream, datatype)
+        if point_list is not None:
+            size += write_point_list(stream, point_list, implicit_closed=True, fast=fast)
+        if x is not None:
+            size += write_sint(stream, x)
+        if y is not None:
+            size += write_sint(stream, y)
+        if repetition is not None:
+            size += repetition.write(stream)
         return size
 
 
+# Path extensions for 2-bit extension schemes 0-2; scheme 3 (arbitrary) carries its own value.
+_PATHEXT_LUT: tuple[pathextension_t | None, ...] = (
+    None,
+    (PathExtensionScheme.Flush, None),
+    (PathExtensionScheme.HalfWidth, None),
+    None,
+    )
+
+
 class Path(Record, GeometryMixin):
     """
     Polygon record (ID 22)
     """
-    layer: int | None = None
-    datatype: int | None = None
-    x: int | None = None
-    y: int | None = None
-    repetition: repetition_t | None = None
-    point_list: point_list_t | None = None
+    __slots__ = (
+        'layer', 'datatype', 'x', 'y', 'repetition', 'point_list', 'half_width',
+        'extension_start', 'extension_end', 'properties',
+        )
+    _MODAL_FIELDS = (
+        ('layer', 'layer'),
+        ('datatype', 'datatype'),
+        ('point_list', 'path_point_list'),
+        ('half_width', 'path_half_width'),
+        ('extension_start', 'path_extension_start'),
+        ('extension_end', 'path_extension_end'),
+        )
+
+    layer: int | None
+    datatype: int | None
+    x: int | None
+    y: int | None
+    repetition: repetition_t | None
+    point_list: point_list_t | None
     """
     List of offsets from the initial vertex (x, y) to the remaining vertices,
     `[[dx0, dy0], [dx1, dy1], ...]`.
@@ -1833,10 +2438,10 @@ class Path(Record, GeometryMixin):
     Offsets are [int, int]; `None` means reuse modal.
     """
 
-    half_width: int | None = None
+    half_width: int | None
     """None means reuse modal"""
 
-    extension_start: pathextension_t | None = None
+    extension_start: pathextension_t | None
     """
     `None` means reuse modal.
     Tuple is of the form (`PathExtensionScheme`, int | None)
@@ -1844,7 +2449,7 @@ class Path(Record, GeometryMixin):
     Value determines extension past start point.
     """
 
-    extension_end: pathextension_t | None = None
+    extension_end: pathextension_t | None
     """
     Same form as `extension_end`. Value determines extension past end point.
     """
@@ -1875,6 +2480,48 @@ class Path(Record, GeometryMixin):
         self.extension_end = extension_end
         self.properties = [] if properties is None else properties
 
+    @staticmethod
+    def _new(
+            point_list: point_list_t | None,
+            half_width: int | None,
+            extension_start: pathextension_t | None,
+            extension_end: pathextension_t | None,
+            layer: int | None,
+            datatype: int | None,
+            x: int | None,
+            y: int | None,
+            repetition: repetition_t | None,
+            ) -> 'Path':
+        """
+        Unchecked constructor for `read()`, which has already validated the fields.
+        """
+        self = Path.__new__(Path)
+        self.layer = layer
+        self.datatype = datatype
+        self.x = x
+        self.y = y
+        self.repetition = repetition
+        self.point_list = point_list
+        self.half_width = half_width
+        self.extension_start = extension_start
+        self.extension_end = extension_end
+        self.properties = []
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'Path':
+        return Path(
+            point_list=_copy_point_list(self.point_list),
+            half_width=self.half_width,
+            extension_start=self.extension_start,
+            extension_end=self.extension_end,
+            layer=self.layer,
+            datatype=self.datatype,
+            x=self.x,
+            y=self.y,
+            repetition=copy.deepcopy(self.repetition, memo),
+            properties=_copy_properties(self.properties, memo),
+            )
+
     def get_point_list(self) -> point_list_t:
         return verify_modal(self.point_list)
 
@@ -1888,24 +2535,14 @@ class Path(Record, GeometryMixin):
         return verify_modal(self.extension_end)
 
     def merge_with_modals(self, modals: Modals) -> None:
-        adjust_coordinates(self, modals, 'geometry_x', 'geometry_y')
+        _adjust_geometry_xy(self, modals)
         adjust_repetition(self, modals)
-        adjust_field(self, 'layer', modals, 'layer')
-        adjust_field(self, 'datatype', modals, 'datatype')
-        adjust_field(self, 'point_list', modals, 'path_point_list')
-        adjust_field(self, 'half_width', modals, 'path_half_width')
-        adjust_field(self, 'extension_start', modals, 'path_extension_start')
-        adjust_field(self, 'extension_end', modals, 'path_extension_end')
+        self._merge_modal_fields(modals)
 
     def deduplicate_with_modals(self, modals: Modals) -> None:
-        dedup_coordinates(self, modals, 'geometry_x', 'geometry_y')
+        _dedup_geometry_xy(self, modals)
         dedup_repetition(self, modals)
-        dedup_field(self, 'layer', modals, 'layer')
-        dedup_field(self, 'datatype', modals, 'datatype')
-        dedup_field(self, 'point_list', modals, 'path_point_list')
-        dedup_field(self, 'half_width', modals, 'path_half_width')
-        dedup_field(self, 'extension_start', modals, 'path_extension_start')
-        dedup_field(self, 'extension_end', modals, 'path_extension_end')
+        self._dedup_modal_fields(modals)
 
     @staticmethod
     def read(stream: IO[bytes], record_id: int) -> 'Path':
@@ -1913,84 +2550,89 @@ class Path(Record, GeometryMixin):
             raise InvalidDataError(f'Invalid record id for Path: {record_id}')
 
         ee, ww, pp, xx, yy, rr, dd, ll = read_bool_byte(stream)
-        optional: dict[str, Any] = {}
-        if ll:
-            optional['layer'] = read_uint(stream)
-        if dd:
-            optional['datatype'] = read_uint(stream)
-        if ww:
-            optional['half_width'] = read_uint(stream)
+        layer = read_uint(stream) if ll else None
+        datatype = read_uint(stream) if dd else None
+        half_width = read_uint(stream) if ww else None
         if ee:
             scheme = read_uint(stream)
-            scheme_end = scheme & 0b11
             scheme_start = (scheme >> 2) & 0b11
-
-            def get_pathext(ext_scheme: int) -> pathextension_t | None:
-                if ext_scheme == 0:
-                    return None
-                if ext_scheme == 1:
-                    return PathExtensionScheme.Flush, None
-                if ext_scheme == 2:
-                    return PathExtensionScheme.HalfWidth, None
-                if ext_scheme == 3:
-                    return PathExtensionScheme.Arbitrary, read_sint(stream)
-                raise InvalidDataError(f'Invalid ext_scheme: {ext_scheme}')
-
-            optional['extension_start'] = get_pathext(scheme_start)
-            optional['extension_end'] = get_pathext(scheme_end)
-        if pp:
-            optional['point_list'] = read_point_list(stream, implicit_closed=False)
-        if xx:
-            optional['x'] = read_sint(stream)
-        if yy:
-            optional['y'] = read_sint(stream)
-        if rr:
-            optional['repetition'] = read_repetition(stream)
-        record = Path(**optional)
-        logger.debug(f'Record ending at 0x{stream.tell():x}:\n {record}')
+            scheme_end = scheme & 0b11
+            # Arbitrary extension values are stored start-first
+            if scheme_start == 3:
+                extension_start = (PathExtensionScheme.Arbitrary, read_sint(stream))
+            else:
+                extension_start = _PATHEXT_LUT[scheme_start]
+            if scheme_end == 3:
+                extension_end = (PathExtensionScheme.Arbitrary, read_sint(stream))
+            else:
+                extension_end = _PATHEXT_LUT[scheme_end]
+        else:
+            extension_start = None
+            extension_end = None
+        point_list = read_point_list(stream, implicit_closed=False) if pp else None
+        x = read_sint(stream) if xx else None
+        y = read_sint(stream) if yy else None
+        repetition = read_repetition(stream) if rr else None
+        record = Path._new(point_list, half_width, extension_start, extension_end,
+                           layer, datatype, x, y, repetition)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Record ending at 0x%x:\n %s', stream.tell(), record)
         return record
 
     def write(self, stream: IO[bytes], fast: bool = False) -> int:
-        ee = self.extension_start is not None or self.extension_end is not None
-        ww = self.half_width is not None
-        pp = self.point_list is not None
-        xx = self.x is not None
-        yy = self.y is not None
-        rr = self.repetition is not None
-        dd = self.datatype is not None
-        ll = self.layer is not None
-
-        size = write_uint(stream, 21)
-        size += write_bool_byte(stream, (ee, ww, pp, xx, yy, rr, dd, ll))
-        if ll:
-            size += write_uint(stream, self.layer)       # type: ignore
-        if dd:
-            size += write_uint(stream, self.datatype)    # type: ignore
-        if ww:
-            size += write_uint(stream, self.half_width)  # type: ignore
+        layer = self.layer
+        datatype = self.datatype
+        half_width = self.half_width
+        extension_start = self.extension_start
+        extension_end = self.extension_end
+        point_list = self.point_list
+        x = self.x
+        y = self.y
+        repetition = self.repetition
+        ee = extension_start is not None or extension_end is not None
+        ww = half_width is not None
+        pp = point_list is not None
+        xx = x is not None
+        yy = y is not None
+        rr = repetition is not None
+        dd = datatype is not None
+        ll = layer is not None
+
+        info = (ee << 7) | (ww << 6) | (pp << 5) | (xx << 4) | (yy << 3) | (rr << 2) | (dd << 1) | ll     # EWPXYRDL
+        size = stream.write(bytes((22, info)))
+        if layer is not None:
+            size += write_uint(stream, layer)
+        if datatype is not None:
+            size += write_uint(stream, datatype)
+        if half_width is not None:
+            size += write_uint(stream, half_width)
         if ee:
             scheme = 0
-            if self.extension_start is not None:
-                scheme += self.extension_start[0].value << 2
-            if self.extension_end is not None:
-                scheme += self.extension_end[0].value
+            if extension_start is not None:
+                scheme += extension_start[0].value << 2
+            if extension_end is not None:
+                scheme += extension_end[0].value
             size += write_uint(stream, scheme)
             if scheme & 0b1100 == 0b1100:
-                size += write_sint(stream, self.extension_start[1])  # type: ignore
+                size += write_sint(stream, extension_start[1])  # type: ignore
             if scheme & 0b0011 == 0b0011:
-                size += write_sint(stream, self.extension_end[1])    # type: ignore
-        if pp:
-            size += write_point_list(stream, self.point_list,        # type: ignore
-                                     implicit_closed=False, fast=fast)
-        if xx:
-            size += write_sint(stream, self.x)      # type: ignore
-        if yy:
-            size += write_sint(stream, self.y)      # type: ignore
-        if rr:
-            size += self.repetition.write(stream)   # type: ignore
+                size += write_sint(stream, extension_end[1])    # type: ignore
+        if point_list is not None:
+            size += write_point_list(stream, point_list, implicit_closed=False, fast=fast)
+        if x is not None:
+            size += write_sint(stream, x)
+        if y is not None:
+            size += write_sint(stream, y)
+        if repetition is not None:
+            size += repetition.write(stream)
         return size
 
 
+# Trapezoid record id, indexed by `((delta_a == 0) << 1) | (delta_b == 0)`.
+#  Record 24 omits delta_b, record 25 omits delta_a.
+_TRAPEZOID_RECORD_IDS = (23, 24, 25, 24)
+
+
 class Trapezoid(Record, GeometryMixin):
     """
     Trapezoid record (ID 23, 24, 25)
@@ -1998,33 +2640,44 @@ class Trapezoid(Record, GeometryMixin):
     Trapezoid with at least two sides parallel to the x- or y-axis.
     (x, y) denotes the lower-left (min-x, min-y) corner of the trapezoid's bounding box.
     """
-    layer: int | None = None
-    datatype: int | None = None
-    width: int | None = None
+    __slots__ = (
+        'layer', 'datatype', 'width', 'height', 'x', 'y', 'repetition',
+        'delta_a', 'delta_b', 'is_vertical', 'properties',
+        )
+    _MODAL_FIELDS = (
+        ('layer', 'layer'),
+        ('datatype', 'datatype'),
+        ('width', 'geometry_w'),
+        ('height', 'geometry_h'),
+        )
+
+    layer: int | None
+    datatype: int | None
+    width: int | None
     """Bounding box x-width, None means reuse modal."""
 
-    height: int | None = None
+    height: int | None
     """Bounding box y-height, None means reuse modal."""
 
-    x: int | None = None
+    x: int | None
     """x-offset to lower-left corner of the trapezoid's bounding box.
        None means reuse modal
     """
 
-    y: int | None = None
+    y: int | None
     """y-offset to lower-left corner of the trapezoid's bounding box.
        None means reuse modal
     """
 
-    repetition: repetition_t | None = None
-    delta_a: int = 0
+    repetition: repetition_t | None
+    delta_a: int
     """
     If horizontal, signed x-distance from top left vertex to bottom left vertex.
     If vertical, signed y-distance from bottom left vertex to bottom right vertex.
     None means reuse modal.
     """
 
-    delta_b: int = 0
+    delta_b: int
     """
     If horizontal, signed x-distance from bottom right vertex to top right vertex.
     If vertical, signed y-distance from top right vertex to top left vertex.
@@ -2068,12 +2721,52 @@ class Trapezoid(Record, GeometryMixin):
         self.y = y
         self.repetition = repetition
         self.properties = [] if properties is None else properties
+        self.check_valid()
 
-        if self.is_vertical:
-            if height is not None and delta_b - delta_a > height:
-                raise InvalidDataError(f'Trapezoid: h < delta_b - delta_a ({height} < {delta_b} - {delta_a})')
-        elif width is not None and delta_b - delta_a > width:
-            raise InvalidDataError(f'Trapezoid: w < delta_b - delta_a ({width} < {delta_b} - {delta_a})')
+    @staticmethod
+    def _new(
+            is_vertical: bool,
+            delta_a: int,
+            delta_b: int,
+            layer: int | None,
+            datatype: int | None,
+            width: int | None,
+            height: int | None,
+            x: int | None,
+            y: int | None,
+            repetition: repetition_t | None,
+            ) -> 'Trapezoid':
+        """
+        Unvalidated constructor for `read()`; the caller must run `check_valid()`.
+        """
+        self = Trapezoid.__new__(Trapezoid)
+        self.is_vertical = is_vertical
+        self.delta_a = delta_a
+        self.delta_b = delta_b
+        self.layer = layer
+        self.datatype = datatype
+        self.width = width
+        self.height = height
+        self.x = x
+        self.y = y
+        self.repetition = repetition
+        self.properties = []
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'Trapezoid':
+        return Trapezoid(
+            is_vertical=self.is_vertical,
+            delta_a=self.delta_a,
+            delta_b=self.delta_b,
+            width=self.width,
+            height=self.height,
+            layer=self.layer,
+            datatype=self.datatype,
+            x=self.x,
+            y=self.y,
+            repetition=copy.deepcopy(self.repetition, memo),
+            properties=_copy_properties(self.properties, memo),
+            )
 
     def get_is_vertical(self) -> bool:
         return verify_modal(self.is_vertical)
@@ -2091,20 +2784,14 @@ class Trapezoid(Record, GeometryMixin):
         return verify_modal(self.height)
 
     def merge_with_modals(self, modals: Modals) -> None:
-        adjust_coordinates(self, modals, 'geometry_x', 'geometry_y')
+        _adjust_geometry_xy(self, modals)
         adjust_repetition(self, modals)
-        adjust_field(self, 'layer', modals, 'layer')
-        adjust_field(self, 'datatype', modals, 'datatype')
-        adjust_field(self, 'width', modals, 'geometry_w')
-        adjust_field(self, 'height', modals, 'geometry_h')
+        self._merge_modal_fields(modals)
 
     def deduplicate_with_modals(self, modals: Modals) -> None:
-        dedup_coordinates(self, modals, 'geometry_x', 'geometry_y')
+        _dedup_geometry_xy(self, modals)
         dedup_repetition(self, modals)
-        dedup_field(self, 'layer', modals, 'layer')
-        dedup_field(self, 'datatype', modals, 'datatype')
-        dedup_field(self, 'width', modals, 'geometry_w')
-        dedup_field(self, 'height', modals, 'geometry_h')
+        self._dedup_modal_fields(modals)
 
     @staticmethod
     def read(stream: IO[bytes], record_id: int) -> 'Trapezoid':
@@ -2112,67 +2799,92 @@ class Trapezoid(Record, GeometryMixin):
             raise InvalidDataError(f'Invalid record id for Trapezoid: {record_id}')
 
         is_vertical, ww, hh, xx, yy, rr, dd, ll = read_bool_byte(stream)
-        optional: dict[str, Any] = {}
-        if ll:
-            optional['layer'] = read_uint(stream)
-        if dd:
-            optional['datatype'] = read_uint(stream)
-        if ww:
-            optional['width'] = read_uint(stream)
-        if hh:
-            optional['height'] = read_uint(stream)
-        if record_id != 25:
-            optional['delta_a'] = read_sint(stream)
-        if record_id != 24:
-            optional['delta_b'] = read_sint(stream)
-        if xx:
-            optional['x'] = read_sint(stream)
-        if yy:
-            optional['y'] = read_sint(stream)
-        if rr:
-            optional['repetition'] = read_repetition(stream)
-        record = Trapezoid(bool(is_vertical), **optional)
-        logger.debug(f'Record ending at 0x{stream.tell():x}:\n {record}')
+        layer = read_uint(stream) if ll else None
+        datatype = read_uint(stream) if dd else None
+        width = read_uint(stream) if ww else None
+        height = read_uint(stream) if hh else None
+        delta_a = read_sint(stream) if record_id != 25 else 0
+        delta_b = read_sint(stream) if record_id != 24 else 0
+        x = read_sint(stream) if xx else None
+        y = read_sint(stream) if yy else None
+        repetition = read_repetition(stream) if rr else None
+
+        record = Trapezoid._new(is_vertical, delta_a, delta_b, layer, datatype, width, height, x, y, repetition)
+        record.check_valid()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Record ending at 0x%x:\n %s', stream.tell(), record)
         return record
 
     def write(self, stream: IO[bytes]) -> int:
+        layer = self.layer
+        datatype = self.datatype
+        width = self.width
+        height = self.height
+        delta_a = self.delta_a
+        delta_b = self.delta_b
+        x = self.x
+        y = self.y
+        repetition = self.repetition
         vv = self.is_vertical
-        ww = self.width is not None
-        hh = self.height is not None
-        xx = self.x is not None
-        yy = self.y is not None
-        rr = self.repetition is not None
-        dd = self.datatype is not None
-        ll = self.layer is not None
-
-        if self.delta_b == 0:
-            record_id = 24
-        elif self.delta_a == 0:
-            record_id = 25
-        else:
-            record_id = 23
-        size = write_uint(stream, record_id)
-        size += write_bool_byte(stream, (vv, ww, hh, xx, yy, rr, dd, ll))
-        if ll:
-            size += write_uint(stream, self.layer)      # type: ignore
-        if dd:
-            size += write_uint(stream, self.datatype)   # type: ignore
-        if ww:
-            size += write_uint(stream, self.width)      # type: ignore
-        if hh:
-            size += write_uint(stream, self.height)     # type: ignore
+        ww = width is not None
+        hh = height is not None
+        xx = x is not None
+        yy = y is not None
+        rr = repetition is not None
+        dd = datatype is not None
+        ll = layer is not None
+
+        record_id = _TRAPEZOID_RECORD_IDS[((delta_a == 0) << 1) | (delta_b == 0)]
+        info = (vv << 7) | (ww << 6) | (hh << 5) | (xx << 4) | (yy << 3) | (rr << 2) | (dd << 1) | ll     # OWHXYRDL
+        size = stream.write(bytes((record_id, info)))
+        if layer is not None:
+            size += write_uint(stream, layer)
+        if datatype is not None:
+            size += write_uint(stream, datatype)
+        if width is not None:
+            size += write_uint(stream, width)
+        if height is not None:
+            size += write_uint(stream, height)
         if record_id != 25:
-            size += write_sint(stream, self.delta_a)    # type: ignore
+            size += write_sint(stream, delta_a)
         if record_id != 24:
-            size += write_sint(stream, self.delta_b)    # type: ignore
-        if xx:
-            size += write_sint(stream, self.x)          # type: ignore
-        if yy:
-            size += write_sint(stream, self.y)          # type: ignore
-        if rr:
-            size += self.repetition.write(stream)       # type: ignore
+            size += write_sint(stream, delta_b)
+        if x is not None:
+            size += write_sint(stream, x)
+        if y is not None:
+            size += write_sint(stream, y)
+        if repetition is not None:
+            size += repetition.write(stream)
         return size
 
+    def check_valid(self) -> None:
+        delta_a = self.delta_a
+        delta_b = self.delta_b
+        if self.is_vertical:
+            height = self.height
+            if height is not None and delta_b - delta_a > height:
+                raise InvalidDataError(f'Trapezoid: h < delta_b - delta_a ({height} < {delta_b} - {delta_a})')
+        else:
+            width = self.width
+            if width is not None and delta_b - delta_a > width:
+                raise InvalidDataError(f'Trapezoid: w < delta_b - delta_a ({width} < {delta_b} - {delta_a})')
+
+
+# CTrapezoid type sets, as bitmasks over `1 << ctrapezoid_type`
+_CTRAPEZOID_NO_WIDTH = (1 << 20) | (1 << 21)
+"""Types whose width is implied by their height"""
+_CTRAPEZOID_NO_HEIGHT = (1 << 16) | (1 << 17) | (1 << 18) | (1 << 19) | (1 << 22) | (1 << 23) | (1 << 25)
+"""Types whose height is implied by their width"""
+
+
+def _ctrapezoid_type_bit(ctrapezoid_type: int | None) -> int:
+    """
+    `1 << ctrapezoid_type` for valid types, or 0 for `None` or an invalid type.
+    """
+    if ctrapezoid_type is None or not 0 <= ctrapezoid_type < 26:
+        return 0
+    return 1 << ctrapezoid_type
+
 
 class CTrapezoid(Record, GeometryMixin):
     r"""
@@ -2213,31 +2925,37 @@ class CTrapezoid(Record, GeometryMixin):
     set h = None  set w = None            set h = None
 
     """
-    ctrapezoid_type: int | None = None
+    __slots__ = (
+        'ctrapezoid_type', 'layer', 'datatype', 'width', 'height', 'x', 'y',
+        'repetition', 'properties',
+        )
+    _MODAL_FIELDS = (('layer', 'layer'), ('datatype', 'datatype'), ('ctrapezoid_type', 'ctrapezoid_type'))
+
+    ctrapezoid_type: int | None
     """See class docstring for details. None means reuse modal."""
 
-    layer: int | None = None
-    datatype: int | None = None
-    width: int | None = None
+    layer: int | None
+    datatype: int | None
+    width: int | None
     """width: Bounding box x-width
        None means unnecessary, or reuse modal if necessary.
     """
 
-    height: int | None = None
+    height: int | None
     """Bounding box y-height.
        None means unnecessary, or reuse modal if necessary.
     """
 
-    x: int | None = None
+    x: int | None
     """x-offset of lower-left (min-x) point of bounding box.
        None means reuse modal
     """
-    y: int | None = None
+    y: int | None
     """y-offset of lower-left (min-y) point of bounding box.
        None means reuse modal
     """
 
-    repetition: repetition_t | None = None
+    repetition: repetition_t | None
     properties: list['Property']
 
     def __init__(
@@ -2268,64 +2986,96 @@ class CTrapezoid(Record, GeometryMixin):
 
         self.check_valid()
 
+    @staticmethod
+    def _new(
+            ctrapezoid_type: int | None,
+            layer: int | None,
+            datatype: int | None,
+            width: int | None,
+            height: int | None,
+            x: int | None,
+            y: int | None,
+            repetition: repetition_t | None,
+            ) -> 'CTrapezoid':
+        """
+        Unvalidated constructor for `read()`; the caller must run `check_valid()`.
+        """
+        self = CTrapezoid.__new__(CTrapezoid)
+        self.ctrapezoid_type = ctrapezoid_type
+        self.layer = layer
+        self.datatype = datatype
+        self.width = width
+        self.height = height
+        self.x = x
+        self.y = y
+        self.repetition = repetition
+        self.properties = []
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'CTrapezoid':
+        return CTrapezoid(
+            ctrapezoid_type=self.ctrapezoid_type,
+            width=self.width,
+            height=self.height,
+            layer=self.layer,
+            datatype=self.datatype,
+            x=self.x,
+            y=self.y,
+            repetition=copy.deepcopy(self.repetition, memo),
+            properties=_copy_properties(self.properties, memo),
+            )
+
     def get_ctrapezoid_type(self) -> int:
         return verify_modal(self.ctrapezoid_type)
 
     def get_height(self) -> int:
-        if self.ctrapezoid_type is None:
-            return verify_modal(self.height)
-        if self.ctrapezoid_type in (16, 17, 18, 19, 22, 23, 25):
+        if _ctrapezoid_type_bit(self.ctrapezoid_type) & _CTRAPEZOID_NO_HEIGHT:
             return verify_modal(self.width)
         return verify_modal(self.height)
 
     def get_width(self) -> int:
-        if self.ctrapezoid_type is None:
-            return verify_modal(self.width)
-        if self.ctrapezoid_type in (20, 21):
+        if _ctrapezoid_type_bit(self.ctrapezoid_type) & _CTRAPEZOID_NO_WIDTH:
             return verify_modal(self.height)
         return verify_modal(self.width)
 
     def merge_with_modals(self, modals: Modals) -> None:
-        adjust_coordinates(self, modals, 'geometry_x', 'geometry_y')
+        _adjust_geometry_xy(self, modals)
         adjust_repetition(self, modals)
-        adjust_field(self, 'layer', modals, 'layer')
-        adjust_field(self, 'datatype', modals, 'datatype')
-        adjust_field(self, 'ctrapezoid_type', modals, 'ctrapezoid_type')
+        self._merge_modal_fields(modals)
 
-        if self.ctrapezoid_type in (20, 21):
+        type_bit = _ctrapezoid_type_bit(self.ctrapezoid_type)
+        if type_bit & _CTRAPEZOID_NO_WIDTH:
             if self.width is not None:
                 raise InvalidDataError(f'CTrapezoid has spurious width entry: {self.width}')
         else:
-            adjust_field(self, 'width', modals, 'geometry_w')
+            _merge_width(self, modals)
 
-        if self.ctrapezoid_type in (16, 17, 18, 19, 22, 23, 25):
+        if type_bit & _CTRAPEZOID_NO_HEIGHT:
             if self.height is not None:
                 raise InvalidDataError(f'CTrapezoid has spurious height entry: {self.height}')
         else:
-            adjust_field(self, 'height', modals, 'geometry_h')
+            _merge_height(self, modals)
 
         self.check_valid()
 
     def deduplicate_with_modals(self, modals: Modals) -> None:
-        dedup_coordinates(self, modals, 'geometry_x', 'geometry_y')
+        _dedup_geometry_xy(self, modals)
         dedup_repetition(self, modals)
-        dedup_field(self, 'layer', modals, 'layer')
-        dedup_field(self, 'datatype', modals, 'datatype')
-        dedup_field(self, 'width', modals, 'geometry_w')
-        dedup_field(self, 'height', modals, 'geometry_h')
-        dedup_field(self, 'ctrapezoid_type', modals, 'ctrapezoid_type')
+        self._dedup_modal_fields(modals)
 
-        if self.ctrapezoid_type in (20, 21):
+        # self.ctrapezoid_type may have just been deduplicated away; the modal holds the actual type
+        type_bit = _ctrapezoid_type_bit(modals.ctrapezoid_type)
+        if type_bit & _CTRAPEZOID_NO_WIDTH:
             if self.width is not None:
                 raise InvalidDataError(f'CTrapezoid has spurious width entry: {self.width}')
         else:
-            dedup_field(self, 'width', modals, 'geometry_w')
+            _dedup_width(self, modals)
 
-        if self.ctrapezoid_type in (16, 17, 18, 19, 22, 23, 25):
+        if type_bit & _CTRAPEZOID_NO_HEIGHT:
             if self.height is not None:
                 raise InvalidDataError(f'CTrapezoid has spurious height entry: {self.height}')
         else:
-            dedup_field(self, 'height', modals, 'geometry_h')
+            _dedup_height(self, modals)
 
         self.check_valid()
 
@@ -2335,55 +3085,56 @@ class CTrapezoid(Record, GeometryMixin):
             raise InvalidDataError(f'Invalid record id for CTrapezoid: {record_id}')
 
         tt, ww, hh, xx, yy, rr, dd, ll = read_bool_byte(stream)
-        optional: dict[str, Any] = {}
-        if ll:
-            optional['layer'] = read_uint(stream)
-        if dd:
-            optional['datatype'] = read_uint(stream)
-        if tt:
-            optional['ctrapezoid_type'] = read_uint(stream)
-        if ww:
-            optional['width'] = read_uint(stream)
-        if hh:
-            optional['height'] = read_uint(stream)
-        if xx:
-            optional['x'] = read_sint(stream)
-        if yy:
-            optional['y'] = read_sint(stream)
-        if rr:
-            optional['repetition'] = read_repetition(stream)
-        record = CTrapezoid(**optional)
-        logger.debug(f'Record ending at 0x{stream.tell():x}:\n {record}')
+        layer = read_uint(stream) if ll else None
+        datatype = read_uint(stream) if dd else None
+        ctrapezoid_type = read_uint(stream) if tt else None
+        width = read_uint(stream) if ww else None
+        height = read_uint(stream) if hh else None
+        x = read_sint(stream) if xx else None
+        y = read_sint(stream) if yy else None
+        repetition = read_repetition(stream) if rr else None
+        record = CTrapezoid._new(ctrapezoid_type, layer, datatype, width, height, x, y, repetition)
+        record.check_valid()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Record ending at 0x%x:\n %s', stream.tell(), record)
         return record
 
     def write(self, stream: IO[bytes]) -> int:
-        tt = self.ctrapezoid_type is not None
-        ww = self.width is not None
-        hh = self.height is not None
-        xx = self.x is not None
-        yy = self.y is not None
-        rr = self.repetition is not None
-        dd = self.datatype is not None
-        ll = self.layer is not None
-
-        size = write_uint(stream, 26)
-        size += write_bool_byte(stream, (tt, ww, hh, xx, yy, rr, dd, ll))
-        if ll:
-            size += write_uint(stream, self.layer)      # type: ignore
-        if dd:
-            size += write_uint(stream, self.datatype)   # type: ignore
-        if tt:
-            size += write_uint(stream, self.ctrapezoid_type)  # type: ignore
-        if ww:
-            size += write_uint(stream, self.width)      # type: ignore
-        if hh:
-            size += write_uint(stream, self.height)     # type: ignore
-        if xx:
-            size += write_sint(stream, self.x)          # type: ignore
-        if yy:
-            size += write_sint(stream, self.y)          # type: ignore
-        if rr:
-            size += self.repetition.write(stream)       # type: ignore
+        layer = self.layer
+        datatype = self.datatype
+        ctrapezoid_type = self.ctrapezoid_type
+        width = self.width
+        height = self.height
+        x = self.x
+        y = self.y
+        repetition = self.repetition
+        tt = ctrapezoid_type is not None
+        ww = width is not None
+        hh = height is not None
+        xx = x is not None
+        yy = y is not None
+        rr = repetition is not None
+        dd = datatype is not None
+        ll = layer is not None
+
+        info = (tt << 7) | (ww << 6) | (hh << 5) | (xx << 4) | (yy << 3) | (rr << 2) | (dd << 1) | ll     # TWHXYRDL
+        size = stream.write(bytes((26, info)))
+        if layer is not None:
+            size += write_uint(stream, layer)
+        if datatype is not None:
+            size += write_uint(stream, datatype)
+        if ctrapezoid_type is not None:
+            size += write_uint(stream, ctrapezoid_type)
+        if width is not None:
+            size += write_uint(stream, width)
+        if height is not None:
+            size += write_uint(stream, height)
+        if x is not None:
+            size += write_sint(stream, x)
+        if y is not None:
+            size += write_sint(stream, y)
+        if repetition is not None:
+            size += repetition.write(stream)
         return size
 
     def check_valid(self) -> None:
@@ -2391,29 +3142,42 @@ class CTrapezoid(Record, GeometryMixin):
         width = self.width
         height = self.height
 
-        if ctrapezoid_type in (20, 21) and width is not None:
+        if ctrapezoid_type is None:
+            return
+        type_bit = _ctrapezoid_type_bit(ctrapezoid_type)
+        if not type_bit:
+            raise InvalidDataError(f'CTrapezoid has invalid type: {ctrapezoid_type}')
+
+        if type_bit & _CTRAPEZOID_NO_WIDTH and width is not None:
             raise InvalidDataError(f'CTrapezoid has spurious width entry: {width}')
-        if ctrapezoid_type in (16, 17, 18, 19, 22, 23, 25) and height is not None:
+        if type_bit & _CTRAPEZOID_NO_HEIGHT and height is not None:
             raise InvalidDataError(f'CTrapezoid has spurious height entry: {height}')
 
-        if width is not None and height is not None:
-            if ctrapezoid_type in range(0, 4) and width < height:           # noqa: PIE808
+        if width is None or height is None or ctrapezoid_type >= 16:
+            return
+
+        # Types 0-15 come in groups of four sharing a width/height constraint
+        category = ctrapezoid_type >> 2
+        if category == 0:
+            if width < height:
                 raise InvalidDataError(f'CTrapezoid has width < height ({width} < {height})')
-            if ctrapezoid_type in range(4, 8) and width < 2 * height:
+        elif category == 1:
+            if width < 2 * height:
                 raise InvalidDataError(f'CTrapezoid has width < 2*height ({width} < 2 * {height})')
-            if ctrapezoid_type in range(8, 12) and width > height:
+        elif category == 2:
+            if width > height:
                 raise InvalidDataError(f'CTrapezoid has width > height ({width} > {height})')
-            if ctrapezoid_type in range(12, 16) and 2 * width > height:
-                raise InvalidDataError(f'CTrapezoid has 2*width > height ({width} > 2 * {height})')
-
-        if ctrapezoid_type is not None and ctrapezoid_type not in range(0, 26):   # noqa: PIE808
-            raise InvalidDataError(f'CTrapezoid has invalid type: {ctrapezoid_type}')
+        elif 2 * width > height:
+            raise InvalidDataError(f'CTrapezoid has 2*width > height ({width} > 2 * {height})')
 
 
 class Circle(Record, GeometryMixin):
     """
     Circle record (ID 27)
     """
+    __slots__ = ('layer', 'datatype', 'x', 'y', 'repetition', 'radius', 'properties')
+    _MODAL_FIELDS = (('layer', 'layer'), ('datatype', 'datatype'), ('radius', 'circle_radius'))
+
     layer: int | None
     datatype: int | None
     x: int | None
@@ -2453,22 +3217,51 @@ class Circle(Record, GeometryMixin):
         self.repetition = repetition
         self.properties = [] if properties is None else properties
 
+    @staticmethod
+    def _new(
+            radius: int | None,
+            layer: int | None,
+            datatype: int | None,
+            x: int | None,
+            y: int | None,
+            repetition: repetition_t | None,
+            ) -> 'Circle':
+        """
+        Unchecked constructor for `read()`, which has already validated the fields.
+        """
+        self = Circle.__new__(Circle)
+        self.radius = radius
+        self.layer = layer
+        self.datatype = datatype
+        self.x = x
+        self.y = y
+        self.repetition = repetition
+        self.properties = []
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'Circle':
+        return Circle(
+            radius=self.radius,
+            layer=self.layer,
+            datatype=self.datatype,
+            x=self.x,
+            y=self.y,
+            repetition=copy.deepcopy(self.repetition, memo),
+            properties=_copy_properties(self.properties, memo),
+            )
+
     def get_radius(self) -> int:
         return verify_modal(self.radius)
 
     def merge_with_modals(self, modals: Modals) -> None:
-        adjust_coordinates(self, modals, 'geometry_x', 'geometry_y')
+        _adjust_geometry_xy(self, modals)
         adjust_repetition(self, modals)
-        adjust_field(self, 'layer', modals, 'layer')
-        adjust_field(self, 'datatype', modals, 'datatype')
-        adjust_field(self, 'radius', modals, 'circle_radius')
+        self._merge_modal_fields(modals)
 
     def deduplicate_with_modals(self, modals: Modals) -> None:
-        dedup_coordinates(self, modals, 'geometry_x', 'geometry_y')
+        _dedup_geometry_xy(self, modals)
         dedup_repetition(self, modals)
-        dedup_field(self, 'layer', modals, 'layer')
-        dedup_field(self, 'datatype', modals, 'datatype')
-        dedup_field(self, 'radius', modals, 'circle_radius')
+        self._dedup_modal_fields(modals)
 
     @staticmethod
     def read(stream: IO[bytes], record_id: int) -> 'Circle':
@@ -2479,45 +3272,45 @@ class Circle(Record, GeometryMixin):
         if z0 or z1:
             raise InvalidDataError('Malformed circle header')
 
-        optional: dict[str, Any] = {}
-        if ll:
-            optional['layer'] = read_uint(stream)
-        if dd:
-            optional['datatype'] = read_uint(stream)
-        if has_radius:
-            optional['radius'] = read_uint(stream)
-        if xx:
-            optional['x'] = read_sint(stream)
-        if yy:
-            optional['y'] = read_sint(stream)
-        if rr:
-            optional['repetition'] = read_repetition(stream)
-        record = Circle(**optional)
-        logger.debug(f'Record ending at 0x{stream.tell():x}:\n {record}')
+        layer = read_uint(stream) if ll else None
+        datatype = read_uint(stream) if dd else None
+        radius = read_uint(stream) if has_radius else None
+        x = read_sint(stream) if xx else None
+        y = read_sint(stream) if yy else None
+        repetition = read_repetition(stream) if rr else None
+        record = Circle._new(radius, layer, datatype, x, y, repetition)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Record ending at 0x%x:\n %s', stream.tell(), record)
         return record
 
     def write(self, stream: IO[bytes]) -> int:
-        ss = self.radius is not None
-        xx = self.x is not None
-        yy = self.y is not None
-        rr = self.repetition is not None
-        dd = self.datatype is not None
-        ll = self.layer is not None
-
-        size = write_uint(stream, 27)
-        size += write_bool_byte(stream, (0, 0, ss, xx, yy, rr, dd, ll))
-        if ll:
-            size += write_uint(stream, self.layer)      # type: ignore
-        if dd:
-            size += write_uint(stream, self.datatype)   # type: ignore
-        if ss:
-            size += write_uint(stream, self.radius)     # type: ignore
-        if xx:
-            size += write_sint(stream, self.x)          # type: ignore
-        if yy:
-            size += write_sint(stream, self.y)          # type: ignore
-        if rr:
-            size += self.repetition.write(stream)       # type: ignore
+        layer = self.layer
+        datatype = self.datatype
+        radius = self.radius
+        x = self.x
+        y = self.y
+        repetition = self.repetition
+        ss = radius is not None
+        xx = x is not None
+        yy = y is not None
+        rr = repetition is not None
+        dd = datatype is not None
+        ll = layer is not None
+
+        info = (ss << 5) | (xx << 4) | (yy << 3) | (rr << 2) | (dd << 1) | ll     # 00rXYRDL
+        size = stream.write(bytes((27, info)))
+        if layer is not None:
+            size += write_uint(stream, layer)
+        if datatype is not None:
+            size += write_uint(stream, datatype)
+        if radius is not None:
+            size += write_uint(stream, radius)
+        if x is not None:
+            size += write_sint(stream, x)
+        if y is not None:
+            size += write_sint(stream, y)
+        if repetition is not None:
+            size += repetition.write(stream)
         return size
 
 
@@ -2534,7 +3327,7 @@ def adjust_repetition(record: HasRepetition, modals: Modals) -> None:
             from the modals.
     """
     if record.repetition is not None:
-        if isinstance(record.repetition, ReuseRepetition):
+        if record.repetition is _REUSE_REPETITION:
             if modals.repetition is None:
                 raise InvalidDataError('Unfillable repetition')
             record.repetition = copy.copy(modals.repetition)
@@ -2561,7 +3354,7 @@ def adjust_field(record: Record, r_field: str, modals: Modals, m_field: str) ->
     else:
         m = getattr(modals, m_field)
         if m is not None:
-            setattr(record, r_field, copy.copy(m))
+            setattr(record, r_field, m if m_field in _SCALAR_MODALS else copy.copy(m))
         else:
             raise InvalidDataError(f'Unfillable field: {m_field}')
 
@@ -2613,18 +3406,19 @@ def dedup_repetition(record: HasRepetition, modals: Modals) -> None:
         InvalidDataError: if a `ReuseRepetition` can't be filled
             from the modals.
     """
-    if record.repetition is None:
+    repetition = record.repetition
+    if repetition is None:
         return
 
-    if isinstance(record.repetition, ReuseRepetition):
+    if repetition is _REUSE_REPETITION:
         if modals.repetition is None:
             raise InvalidDataError('Unfillable repetition')
         return
 
-    if record.repetition == modals.repetition:
-        record.repetition = ReuseRepetition()
+    if repetition is modals.repetition or repetition == modals.repetition:
+        record.repetition = _REUSE_REPETITION
     else:
-        modals.repetition = record.repetition
+        modals.repetition = repetition
 
 
 def dedup_field(record: Record, r_field: str, modals: Modals, m_field: str) -> None:
@@ -2645,10 +3439,7 @@ def dedup_field(record: Record, r_field: str, modals: Modals, m_field: str) -> N
     mm = getattr(modals, m_field)
     if rr is not None:
         if m_field in ('polygon_point_list', 'path_point_list'):
-            if _USE_NUMPY:
-                equal = numpy.array_equal(mm, rr)
-            else:
-                equal = (mm is not None) and all(tuple(mmm) == tuple(rrr) for mmm, rrr in zip(mm, rr, strict=True))
+            equal = _point_lists_equal(mm, rr)
         else:
             equal = (mm is not None) and mm == rr
 
@@ -2660,6 +3451,14 @@ def dedup_field(record: Record, r_field: str, modals: Modals, m_field: str) -> N
         raise InvalidDataError('Unfillable field')
 
 
+def _point_lists_equal(mm: point_list_t | None, rr: point_list_t) -> bool:
+    if _USE_NUMPY:
+        return numpy.array_equal(mm, rr)
+    return (mm is not None
+            and len(mm) == len(rr)
+            and all(tuple(mmm) == tuple(rrr) for mmm, rrr in zip(mm, rr, strict=True)))
+
+
 def dedup_coordinates(record: HasXY, modals: Modals, mx_field: str, my_field: str) -> None:
     """
     Deduplicate `record.x` and `record.y` using `modals.mx_field` and `modals.my_field`,
@@ -2680,21 +3479,17 @@ def dedup_coordinates(record: HasXY, modals: Modals, mx_field: str, my_field: st
     """
     if record.x is not None:
         mx = getattr(modals, mx_field)
+        setattr(modals, mx_field, record.x)
         if modals.xy_relative:
             record.x -= mx
-            setattr(modals, mx_field, record.x)
         elif record.x == mx:
             record.x = None
-        else:
-            setattr(modals, mx_field, record.x)
 
     if record.y is not None:
         my = getattr(modals, my_field)
+        setattr(modals, my_field, record.y)
         if modals.xy_relative:
             record.y -= my
-            setattr(modals, my_field, record.y)
         elif record.y == my:
             record.y = None
-        else:
-            setattr(modals, my_field, record.y)
 
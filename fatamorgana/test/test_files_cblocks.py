@@ -1,12 +1,38 @@
 # mypy: disable-error-code="union-attr"
 from typing import IO
-from io import BytesIO
+from io import BytesIO, BufferedReader
 
 from numpy.testing import assert_equal
 
 from .utils import HEADER, FOOTER
-from ..basic import write_uint, write_bstring, write_byte
+from ..basic import read_uint, write_uint, write_bstring, write_byte
 from ..main import OasisLayout
+from ..records import CBlock, CBlockReader
+
+
+# CBLOCK record (id 34) containing the cell's geometry
+CBLOCK_RECORD = bytes.fromhex('''
+    22 00 b0 02 b2 02 13
+    a9 66 60 98 c3 32 89 e5 0e e3 1b 61 91 4a c6 15
+    ac 8f 58 3a f8 be f0 8a 5a b0 30 57 5f 64 6d e4
+    4f bd c8 7a 87 ed 81 f8 02 79 a0 88 68 f5 42 b6
+    4e be 80 99 4c 3b 99 35 97 30 4f 14 d7 3c 14 f4
+    52 50 e4 24 e3 0b f6 9b c2 1a 9a 27 18 57 4b 8a
+    04 ae 65 3f 12 04 24 36 0b 8b 2c f2 e9 14 16 3d
+    c6 73 92 4d 64 21 e3 0b 9e cf 9a 15 4f 59 6f 08
+    83 cc 5d c8 f8 91 7b 25 7f ea 4e e6 03 3c 5b a4
+    66 88 01 85 d8 37 b2 fc 64 bd c8 25 5a 79 92 b1
+    99 4b a3 93 65 26 7b 33 bf e6 69 b6 39 7c a9 4b
+    40 2e e1 3b 28 a6 79 82 69 41 98 f6 14 ae 60 9b
+    d7 4c a2 9a 3d 8c 37 f9 6c 03 3f 32 b6 68 2c 64
+    5c cb f3 9a 49 f3 33 e3 0c a6 dd da 29 2f 98 76
+    80 d4 73 df 64 f9 cb b3 58 33 60 36 d3 13 d6 9b
+    9c b6 9a 3b 98 5f b2 07 2e 64 dc c9 7c 91 4b 24
+    f8 08 cb 6e 45 8d 47 32 1d 12 77 b8 81 4a 59 17
+    68 6a 1f 60 df 28 ac a9 3d 85 b5 5b b6 62 0a ff
+    0c 69 90 7b 36 b3 6c 65 d3 9c c9 f4 40 b1 93 a5
+    47 e0 32 7f 8a e6 54 d6 93 6c a2 0f 14 17 c8 03
+    00''')
 
 
 def base_tests(layout: OasisLayout) -> None:
@@ -34,29 +60,7 @@ def write_file_1(buf: IO[bytes]) -> IO[bytes]:
     write_uint(buf, 14)          # CELL record (explicit)
     write_bstring(buf, b'ABCDH')   # Cell name
 
-    cblock_data = bytes.fromhex('''
-        22 00 b0 02 b2 02 13
-        a9 66 60 98 c3 32 89 e5 0e e3 1b 61 91 4a c6 15
-        ac 8f 58 3a f8 be f0 8a 5a b0 30 57 5f 64 6d e4
-        4f bd c8 7a 87 ed 81 f8 02 79 a0 88 68 f5 42 b6
-        4e be 80 99 4c 3b 99 35 97 30 4f 14 d7 3c 14 f4
-        52 50 e4 24 e3 0b f6 9b c2 1a 9a 27 18 57 4b 8a
-        04 ae 65 3f 12 04 24 36 0b 8b 2c f2 e9 14 16 3d
-        c6 73 92 4d 64 21 e3 0b 9e cf 9a 15 4f 59 6f 08
-        83 cc 5d c8 f8 91 7b 25 7f ea 4e e6 03 3c 5b a4
-        66 88 01 85 d8 37 b2 fc 64 bd c8 25 5a 79 92 b1
-        99 4b a3 93 65 26 7b 33 bf e6 69 b6 39 7c a9 4b
-        40 2e e1 3b 28 a6 79 82 69 41 98 f6 14 ae 60 9b
-        d7 4c a2 9a 3d 8c 37 f9 6c 03 3f 32 b6 68 2c 64
-        5c cb f3 9a 49 f3 33 e3 0c a6 dd da 29 2f 98 76
-        80 d4 73 df 64 f9 cb b3 58 33 60 36 d3 13 d6 9b
-        9c b6 9a 3b 98 5f b2 07 2e 64 dc c9 7c 91 4b 24
-        f8 08 cb 6e 45 8d 47 32 1d 12 77 b8 81 4a 59 17
-        68 6a 1f 60 df 28 ac a9 3d 85 b5 5b b6 62 0a ff
-        0c 69 90 7b 36 b3 6c 65 d3 9c c9 f4 40 b1 93 a5
-        47 e0 32 7f 8a e6 54 d6 93 6c a2 0f 14 17 c8 03
-        00''')
-    for byte in cblock_data:
+    for byte in CBLOCK_RECORD:
         write_byte(buf, byte)
 
     buf.write(FOOTER)
@@ -194,3 +198,31 @@ def test_file_1() -> None:
         [210, -10],
         [10, -190],
         ])
+
+
+def test_cblock_reader() -> None:
+    buf = write_file_1(BytesIO())
+    buf.seek(buf.getvalue().index(CBLOCK_RECORD))      # wherever write_file_1 put it
+    assert read_uint(buf) == 34
+    cblock = CBlock.read(buf, 34)
+    expected = cblock.decompress()
+    assert len(expected) == cblock.decompressed_byte_count
+
+    chunks = list(cblock.decompress_stream(chunk_size=64))
+    assert len(chunks) > 1
+    assert all(0 < len(chunk) <= 64 for chunk in chunks)
+    assert b''.join(chunks) == expected
+
+    # Reads both smaller and larger than the decompression chunk size
+    for read_size in (40, 64, 100):
+        reader = CBlockReader(cblock, chunk_size=64)
+        buffer = bytearray(read_size)
+        data = b''
+        while size := reader.readinto(buffer):
+            assert size <= min(read_size, 64)
+            data += buffer[:size]
+        assert data == expected
+        assert reader.tell() == len(expected)
+        assert reader.readinto(buffer) == 0
+
+    assert BufferedReader(CBlockReader(cblock, chunk_size=64)).read() == expected
@@ -1,7 +1,13 @@
 from itertools import chain
 from io import BytesIO
 
-from ..basic import read_uint, read_sint, write_uint, write_sint
+import numpy
+
+from ..basic import (
+    read_uint, read_sint, write_uint, write_sint, read_point_list, write_point_list,
+    read_bstring, write_bstring,
+    _write_uints, _NUMPY_VARINT_MIN_LEN,
+    )
 
 
 uints = (
@@ -49,6 +55,25 @@ def test_write_uint() -> None:
     assert buffer.getbuffer() == correct_bytes
 
 
+def test_write_uint_numpy_scalar() -> None:
+    for ii in (5, 3_000_000, 2**40):
+        buffer = BytesIO()
+        write_uint(buffer, ii)
+        for dtype in (numpy.int64, numpy.uint64):
+            numpy_buffer = BytesIO()
+            write_uint(numpy_buffer, dtype(ii))
+            assert numpy_buffer.getbuffer() == buffer.getbuffer()
+
+
+def test_write_bstring() -> None:
+    for bstring, expected_size in ((b'', 1), (b'ABC', 4), (b'A' * 200, 202)):
+        buffer = BytesIO()
+        assert write_bstring(buffer, bstring) == expected_size
+        assert len(buffer.getvalue()) == expected_size
+        buffer.seek(0)
+        assert read_bstring(buffer) == bstring
+
+
 def test_read_sint() -> None:
     buffer = BytesIO(bytes.fromhex(
         ''.join([hh for _ii, hh in chain(sints, sints_readonly)])))
@@ -66,3 +91,30 @@ def test_write_sint() -> None:
         ''.join([hh for _ii, hh in sints]))
 
     assert buffer.getbuffer() == correct_bytes
+
+
+def test_write_uints() -> None:
+    values = [ii for ii, _hh in uints] + [2**63, 2**64 - 1]
+    values *= _NUMPY_VARINT_MIN_LEN
+    for vals in (values, values + [2**70]):        # numpy path, and python fallback for >64 bits
+        buffer = BytesIO()
+        for ii in vals:
+            write_uint(buffer, ii)
+
+        bulk_buffer = BytesIO()
+        assert _write_uints(bulk_buffer, vals) == len(buffer.getbuffer())
+        assert bulk_buffer.getbuffer() == buffer.getbuffer()
+
+
+def test_point_list_numpy_large_coordinates() -> None:
+    aa, bb, cc = 3_000_000, 5_000_000, 7_000_000
+    cases = (
+        [[aa, 0], [aa, bb], [cc, bb], [cc, 0]],         # 1-deltas
+        [[aa, 0], [0, bb], [-cc, 0]],                   # Manhattan deltas
+        )
+    for points in cases:
+        buffer = BytesIO()
+        write_point_list(buffer, points, implicit_closed=False)
+        numpy_buffer = BytesIO()
+        write_point_list(numpy_buffer, numpy.array(points), implicit_closed=False)    # type: ignore
+        assert numpy_buffer.getbuffer() == buffer.getbuffer()
@@ -0,0 +1,179 @@
+import os
+from io import BytesIO, FileIO, RawIOBase
+from pathlib import Path
+
+import pytest
+
+from ..basic import AString, NString, InvalidRecordError
+from ..main import OasisLayout, CellName, XName, _map_file
+from ..records import End, LayerName
+from .test_files_cblocks import write_file_1, base_tests
+
+
+PREFIX = b'not part of the layout'
+
+
+class RawBytesIO(RawIOBase):
+    """
+    Unbuffered, seekable in-memory stream which isn't backed by a file (so can't be mapped).
+    """
+    def __init__(self, data: bytes) -> None:
+        self.buf = BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray) -> int:      # type: ignore[override]
+        return self.buf.readinto(buffer)
+
+    def seek(self, pos: int, whence: int = 0) -> int:
+        return self.buf.seek(pos, whence)
+
+    def tell(self) -> int:
+        return self.buf.tell()
+
+
+def _layout_bytes(layout: OasisLayout) -> bytes:
+    buf = BytesIO()
+    layout.write(buf)
+    return buf.getvalue()
+
+
+def _expected() -> tuple[bytes, bytes]:
+    data = write_file_1(BytesIO()).getvalue()
+    return data, _layout_bytes(OasisLayout.read(BytesIO(data)))
+
+
+def test_read_mmap(tmp_path: Path) -> None:
+    data, expected = _expected()
+    path = tmp_path / 'layout.oas'
+    path.write_bytes(PREFIX + data)
+
+    with open(path, 'rb') as ff:
+        ff.read(len(PREFIX))
+        mapped = _map_file(ff)
+        assert mapped is not None
+        mapped.close()
+
+        layout = OasisLayout.read(ff)
+        base_tests(layout)
+        assert _layout_bytes(layout) == expected
+        assert ff.tell() == len(PREFIX) + len(data)
+        assert ff.read() == b''
+
+
+def test_read_mmap_fallback(tmp_path: Path) -> None:
+    data, expected = _expected()
+
+    assert _map_file(BytesIO(data)) is None      # type: ignore
+
+    empty = tmp_path / 'empty.oas'
+    empty.write_bytes(b'')
+    with open(empty, 'rb') as ff:
+        assert _map_file(ff) is None
+
+    rfd, wfd = os.pipe()
+    with open(rfd, 'rb') as reader:
+        with open(wfd, 'wb') as writer:
+            writer.write(data)
+        assert _map_file(reader) is None
+        assert _layout_bytes(OasisLayout.read(reader)) == expected
+
+
+def test_read_unbuffered(tmp_path: Path) -> None:
+    data, expected = _expected()
+    path = tmp_path / 'layout.oas'
+    path.write_bytes(PREFIX + data)
+
+    with open(path, 'rb', buffering=0) as ff:
+        ff.read(len(PREFIX))
+        layout = OasisLayout.read(ff)
+        base_tests(layout)
+        assert _layout_bytes(layout) == expected
+
+        assert not ff.closed
+        assert ff.tell() == len(PREFIX) + len(data)
+        ff.seek(0)
+        assert ff.read() == PREFIX + data
+
+    raw = RawBytesIO(PREFIX + data)
+    raw.read(len(PREFIX))
+    with raw:
+        assert _layout_bytes(OasisLayout.read(raw)) == expected
+        assert not raw.closed
+        assert raw.tell() == len(PREFIX) + len(data)
+
+
+def test_read_position_after_error(tmp_path: Path) -> None:
+    # Both the memory-mapped and unbuffered paths should leave the caller's stream
+    #  where reading stopped, rather than wherever the read-ahead ended.
+    data = write_file_1(BytesIO()).getvalue()
+    contents = PREFIX + data + PREFIX * 1000
+    stop = len(PREFIX) + len(data) + 1     # one byte past End, where the error is noticed
+    path = tmp_path / 'layout.oas'
+    path.write_bytes(contents)
+
+    with open(path, 'rb') as ff:
+        ff.read(len(PREFIX))
+        with pytest.raises(InvalidRecordError):
+            OasisLayout.read(ff)
+        assert ff.tell() == stop
+
+    raw = RawBytesIO(contents)
+    raw.read(len(PREFIX))
+    with raw:
+        with pytest.raises(InvalidRecordError):
+            OasisLayout.read(raw)
+        assert raw.tell() == stop
+
+
+def test_write_unbuffered(tmp_path: Path) -> None:
+    layout = OasisLayout.read(BytesIO(write_file_1(BytesIO()).getvalue()))
+    expected = _layout_bytes(layout)
+    path = tmp_path / 'layout.oas'
+
+    with FileIO(path, 'wb') as ff:
+        ff.write(PREFIX)
+        size = layout.write(ff)
+        assert size == len(expected)
+        assert not ff.closed
+        assert ff.tell() == len(PREFIX) + size
+        ff.write(PREFIX)        # still usable
+
+    assert path.read_bytes() == PREFIX + expected + PREFIX
+
+    base_tests(OasisLayout.read(BytesIO(expected)))
+
+
+def test_write_offset_table() -> None:
+    layout = OasisLayout(unit=1000)
+    layout.cellnames = {0: CellName('CELL_A'), 1: CellName('CELL_B')}
+    layout.propnames = {0: NString('PROP')}
+    layout.xnames = {0: XName(1, b'XNAME')}
+    layout.textstrings = {0: AString('TEXT')}
+    layout.propstrings = {0: AString('PROPSTRING')}
+    layout.layers = [LayerName('LAYER', (1, 1), (2, 2), is_textlayer=False)]
+
+    buf = BytesIO()
+    size = layout.write(buf)
+    data = buf.getvalue()
+    assert size == len(data)
+
+    buf.seek(len(data) - 256)
+    assert buf.read(1)[0] == 2
+    table = End.read(buf, 2, has_offset_table=True).offset_table
+    assert table is not None
+
+    expected_record_ids = (
+        (table.cellnames, 4),       # explicit reference numbers
+        (table.propnames, 8),
+        (table.xnames, 31),
+        (table.textstrings, 6),
+        (table.propstrings, 10),
+        (table.layernames, 11),
+        )
+    for entry, record_id in expected_record_ids:
+        assert data[entry.offset] == record_id
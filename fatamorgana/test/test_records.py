@@ -0,0 +1,182 @@
+from io import BytesIO
+import copy
+import zlib
+
+import numpy
+import pytest
+
+from ..basic import AString, GridRepetition, InvalidDataError, NString, PropStringReference
+
+from ..records import (
+    CBlock, CTrapezoid, Modals, Path, Placement, Property, Rectangle, Trapezoid, XElement, XYMode,
+    dedup_coordinates, read_refname, read_refstring,
+    )
+
+
+def test_xymode_absolute() -> None:
+    record = XYMode(relative=True)
+    assert not record.absolute
+
+    record.absolute = True
+    assert record.absolute
+    assert not record.relative
+
+
+def test_xymode_roundtrip() -> None:
+    for relative in (False, True):
+        buffer = BytesIO()
+        XYMode(relative).write(buffer)
+        buffer.seek(0)
+        record_id = buffer.read(1)[0]
+        assert XYMode.read(buffer, record_id).relative == relative
+
+
+def test_xymode_slots() -> None:
+    record = XYMode(relative=False)
+    assert not hasattr(record, '__dict__')
+    assert repr(record).endswith("{'relative': False}")
+
+
+def test_placement_roundtrip() -> None:
+    cases = (
+        (dict(angle=90), 17),
+        (dict(angle=180, magnification=1), 17),
+        (dict(angle=45), 18),
+        (dict(angle=90, magnification=2.0), 18),
+        )
+    for kwargs, expected_id in cases:
+        buffer = BytesIO()
+        Placement(flip=True, name=3, x=5, y=-7, **kwargs).write(buffer)
+        buffer.seek(0)
+        record_id = buffer.read(1)[0]
+        assert record_id == expected_id
+        record = Placement.read(buffer, record_id)
+        assert record.flip
+        assert record.name == 3
+        assert (record.x, record.y) == (5, -7)
+        assert record.angle == kwargs['angle']
+        assert buffer.read() == b''
+
+
+def test_geometry_slots() -> None:
+    record = Rectangle(is_square=False, layer=1, datatype=2, width=3, height=4, x=5, y=6)
+    assert not hasattr(record, '__dict__')
+    clone = record.copy()
+    assert (clone.layer, clone.width, clone.height, clone.x, clone.y) == (1, 3, 4, 5, 6)
+    assert clone.properties is not record.properties
+
+
+def test_property_string_reference_roundtrip() -> None:
+    values = [PropStringReference(3, ref_type) for ref_type in (AString, bytes, NString)]
+    buffer = BytesIO()
+    Property('PROP', values, is_standard=False).write(buffer)
+    buffer.seek(0)
+    record_id = buffer.read(1)[0]
+    assert Property.read(buffer, record_id).values == values
+    assert buffer.read() == b''
+
+
+def test_ctrapezoid_dedup_without_width() -> None:
+    modals = Modals()
+    for _ in range(2):
+        record = CTrapezoid(ctrapezoid_type=20, layer=1, datatype=2, height=10, x=0, y=0)
+        record.deduplicate_with_modals(modals)
+        assert record.width is None
+    assert modals.geometry_h == 10
+
+
+def test_path_roundtrip() -> None:
+    buffer = BytesIO()
+    Path(point_list=[[10, 0], [0, 20]], half_width=3, layer=1, datatype=2, x=4, y=5).write(buffer)
+    buffer.seek(0)
+    record_id = buffer.read(1)[0]
+    assert record_id == 22
+    record = Path.read(buffer, record_id)
+    assert [list(pp) for pp in record.point_list] == [[10, 0], [0, 20]]     # type: ignore
+    assert (record.half_width, record.layer, record.datatype, record.x, record.y) == (3, 1, 2, 4, 5)
+    assert buffer.read() == b''
+
+
+def test_relative_coordinates_roundtrip() -> None:
+    xs = [100, 150, 200, 200, 120]
+    write_modals = Modals()
+    write_modals.xy_relative = True
+    deltas = []
+    for x in xs:
+        record = Rectangle(is_square=True, layer=1, datatype=2, width=3, x=x, y=7)
+        record.deduplicate_with_modals(write_modals)
+        deltas.append(record.x)
+    assert deltas == [100, 50, 50, 0, -80]
+
+    generic_modals = Modals()
+    generic_modals.xy_relative = True
+    for x, dx in zip(xs, deltas, strict=True):
+        record = Rectangle(is_square=True, layer=1, datatype=2, width=3, x=x, y=7)
+        dedup_coordinates(record, generic_modals, 'geometry_x', 'geometry_y')
+        assert record.x == dx
+
+    read_modals = Modals()
+    read_modals.xy_relative = True
+    for x, dx in zip(xs, deltas, strict=True):
+        record = Rectangle(is_square=True, layer=1, datatype=2, width=3, x=dx, y=0)
+        record.merge_with_modals(read_modals)
+        assert record.x == x
+
+
+def test_cblock_compression_matches_zlib() -> None:
+    data = b'fatamorgana' * 500
+    for args in ({}, {'level': 9}):
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS, **args)    # type: ignore
+        expected = compressor.compress(data) + compressor.flush()
+        cblock = CBlock.from_decompressed(data, compression_args=args)
+        assert cblock.compressed_bytes == expected
+        assert cblock.decompress() == data
+
+
+def test_cblock_from_decompressed_many() -> None:
+    blocks = [bytes(range(ii % 256)) * (ii + 1) for ii in range(12)] + [b'']
+    expected = [CBlock.from_decompressed(block) for block in blocks]
+    for max_workers in (None, 1, 4):
+        cblocks = CBlock.from_decompressed_many(blocks, max_workers=max_workers)
+        assert [cc.compressed_bytes for cc in cblocks] == [cc.compressed_bytes for cc in expected]
+        assert [cc.decompressed_byte_count for cc in cblocks] == [len(block) for block in blocks]
+        assert [cc.decompress() for cc in cblocks] == blocks
+
+    assert CBlock.from_decompressed_many([]) == []
+    assert CBlock.from_decompressed_many(blocks[3:4])[0].decompress() == blocks[3]
+
+
+def test_read_ref_truthy_flags() -> None:
+    assert read_refname(BytesIO(b'\x05'), 4, 2) == 5
+    assert read_refstring(BytesIO(b'\x05'), 'yes', 1) == 5
+    assert read_refname(BytesIO(b'\x01A'), 4, 0).string == 'A'        # type: ignore
+    assert read_refstring(BytesIO(b''), 0, 2) is None
+
+
+def test_deepcopy_independent() -> None:
+    repetition = GridRepetition([10, 0], 3, [0, 20], 2)
+    repetition.a_vector = numpy.array([10, 0])     # type: ignore
+    repetition.b_vector = numpy.array([0, 20])     # type: ignore
+    clone = copy.deepcopy(repetition)
+    repetition.a_vector[0] = 99
+    repetition.b_vector[1] = 99     # type: ignore
+    assert (list(clone.a_vector), list(clone.b_vector)) == ([10, 0], [0, 20])   # type: ignore
+
+    element = XElement(1, b'data', properties=[Property('PROP', [1], is_standard=False)])
+    element_clone = copy.deepcopy(element)
+    assert (element_clone.attribute, element_clone.bstring) == (1, b'data')
+    assert element_clone.properties[0] is not element.properties[0]
+    assert element_clone.properties[0].values == [1]
+
+
+def test_trapezoid_validation() -> None:
+    record = Trapezoid(is_vertical=False, delta_a=0, delta_b=6, width=10, height=3, layer=1, datatype=2, x=0, y=0)
+    record.width = 5
+    buffer = BytesIO()
+    record.write(buffer)
+    buffer.seek(0)
+    record_id = buffer.read(1)[0]
+    with pytest.raises(InvalidDataError):
+        Trapezoid.read(buffer, record_id)
+    with pytest.raises(InvalidDataError):
+        Trapezoid(is_vertical=True, delta_a=-4, delta_b=3, height=5)